@@ -593,20 +593,20 @@ class Gui(wx.Frame):
         # Configure the menu bar
         self.menuBar = wx.MenuBar()
         self.fileMenu = wx.Menu()
-        self.fileMenu.Append(wx.ID_ABOUT, _(_("About")))
-        self.fileMenu.Append(wx.ID_OPEN, _(_("Open File")))
+        self.fileMenu.Append(wx.ID_ABOUT, _("About"))
+        self.fileMenu.Append(wx.ID_OPEN, _("Open File"))
         self.saveMenu = wx.Menu()
         self.saveMenu.Append(
             wx.ID_SAVE,
-            _(_("Save Visible Plot Area")),
+            _("Save Visible Plot Area"),
         )
-        self.saveMenu.Append(wx.ID_SAVEAS, _(_("Save Full Plot")))
-        self.fileMenu.AppendSubMenu(self.saveMenu, _(_("Save Image")))
-        self.fileMenu.Append(wx.ID_EXIT, _(_("Exit")))
-        self.menuBar.Append(self.fileMenu, _(_("File")))
+        self.saveMenu.Append(wx.ID_SAVEAS, _("Save Full Plot"))
+        self.fileMenu.AppendSubMenu(self.saveMenu, _("Save Image"))
+        self.fileMenu.Append(wx.ID_EXIT, _("Exit"))
+        self.menuBar.Append(self.fileMenu, _("File"))
         self.viewMenu = wx.Menu()
-        self.viewMenu.Append(wx.ID_RESET, _(_("Reset View")))
-        self.menuBar.Append(self.viewMenu, _(_("View")))
+        self.viewMenu.Append(wx.ID_RESET, _("Reset View"))
+        self.menuBar.Append(self.viewMenu, _("View"))
         self.SetMenuBar(self.menuBar)
 
         # Canvas for drawing signals
@@ -616,37 +616,37 @@ class Gui(wx.Frame):
         self.text_run = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Cycles to run/continue for:")),
+            _("Cycles to run/continue for:"),
         )
         self.spin = wx.SpinCtrl(self, wx.ID_ANY, "10", max=1000, min=1)
-        self.run_button = wx.Button(self, wx.ID_ANY, _(_("Run")))
-        self.restart_button = wx.Button(self, wx.ID_ANY, _(_("Restart")))
+        self.run_button = wx.Button(self, wx.ID_ANY, _("Run"))
+        self.restart_button = wx.Button(self, wx.ID_ANY, _("Restart"))
         self.text_add_mon = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Select a monitor point to add:")),
+            _("Select a monitor point to add:"),
         )
         self.add_box = wx.Choice(
             self,
             wx.ID_ANY,
             choices=self.not_monitored_list,
         )
-        self.add_button = wx.Button(self, wx.ID_ANY, _(_("Add")))
+        self.add_button = wx.Button(self, wx.ID_ANY, _("Add"))
         self.text_zap_mon = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Select a monitor point to remove:")),
+            _("Select a monitor point to remove:"),
         )
         self.zap_box = wx.Choice(
             self,
             wx.ID_ANY,
             choices=self.monitored_list,
         )
-        self.zap_button = wx.Button(self, wx.ID_ANY, _(_("Remove")))
+        self.zap_button = wx.Button(self, wx.ID_ANY, _("Remove"))
         self.text_switch = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Select a switch to toggle:")),
+            _("Select a switch to toggle:"),
         )
         self.switch_box = wx.Choice(self, wx.ID_ANY, choices=self.switch_names)
         self.toggle_0 = wx.ToggleButton(self, wx.ID_ANY, label="0")
@@ -654,7 +654,7 @@ class Gui(wx.Frame):
         self.replace_text_1 = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Replace connection:")),
+            _("Replace connection:"),
         )
         self.swap_conn_box = wx.Choice(
             self, wx.ID_ANY, choices=self.conn_name_list
@@ -662,10 +662,10 @@ class Gui(wx.Frame):
         self.replace_text_2 = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("with connection:")),
+            _("with connection:"),
         )
         self.new_conn_box = wx.Choice(self, wx.ID_ANY, choices=[])
-        self.replace_button = wx.Button(self, wx.ID_ANY, _(_("Replace")))
+        self.replace_button = wx.Button(self, wx.ID_ANY, _("Replace"))
         self.horizontal_scrollbar = wx.ScrollBar(
             self,
             1,
@@ -1117,8 +1117,8 @@ class Gui(wx.Frame):
                     )
                     undo = True
                 else:
-                    message += _(
-                        "Error! Could not swap connection: "
+                    message += (
+                        _("Error! Could not swap connection: ")
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1157,8 +1157,8 @@ class Gui(wx.Frame):
                 if error == self.network.NO_ERROR:
                     message += _("Successfully undid connection swap.\n")
                 else:
-                    message += _(
-                        "Error! Could not undo connection swap: "
+                    message += (
+                        _("Error! Could not undo connection swap: ")
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1524,6 +1524,5 @@ class Gui(wx.Frame):
             choicebox -- wx.Choice widget
             choices -- list of strings to add as choices
         """
-        choicebox.Clear()
-        for item in choices:
-            choicebox.Append(item)
+        # replace all the items in one update of the widget
+        choicebox.Set(choices)
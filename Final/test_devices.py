@@ -3,10 +3,6 @@ import pytest
 
 from names import Names
 from devices import Devices
-import builtins
-import wx
-
-builtins._ = wx.GetTranslation
 
 
 @pytest.fixture
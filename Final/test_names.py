@@ -1,10 +1,6 @@
 import pytest
 
 from names import Names
-import builtins
-import wx
-
-builtins._ = wx.GetTranslation
 
 
 @pytest.fixture
@@ -8,10 +8,6 @@ from parse import Parser
 from network import Network
 from devices import Devices
 from monitors import Monitors
-import builtins
-import wx
-
-builtins._ = wx.GetTranslation
 
 
 def new_parser(path):
@@ -361,7 +357,7 @@ def test_parser_multiple_errors():  # multiple minor syntax errors
     assert parser.error_count == 18
 
 
-def test_parser_bad_pinname(capfd):  # / instead of , in device definition
+def test_parser_bad_comma_in_device_def(capfd):  # / instead of , in DEVICES
     """Wrong symbol instead of comma in device definition"""
     parser = new_parser(str(Path("test_files/test_parser1.22.txt")))
     assert parser.parse_network() is False
@@ -2,10 +2,6 @@ import pytest
 from pathlib import Path
 from scanner import *
 from names import Names
-import builtins
-import wx
-
-builtins._ = wx.GetTranslation
 
 
 def test_symbol():
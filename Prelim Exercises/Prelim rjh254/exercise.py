@@ -1,80 +1,79 @@
 #!/usr/bin/env python3
 """Preliminary exercises for Part IIA Project GF2."""
+import mmap
+import re
 import sys
 from mynames import MyNames
 
 
 def open_file(path):
-    """Open and return the file specified by path."""
-    fo = open(path,'r')
-    return fo
+    """Read the file specified by path into memory.
+
+    Return the memory-mapped file bytes and a one-element list holding the
+    read position. The file is assumed to be ASCII.
+    """
+    with open(path, 'rb') as fo:
+        if fo.seek(0, 2) == 0:  # empty files cannot be mapped
+            return b'', [0]
+        return mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ), [0]
 
 
 def get_next_character(input_file):
     """Read and return the next character in input_file."""
-    next_character = input_file.read(1)
+    text, pos = input_file
+    next_character = text[pos[0]:pos[0] + 1].decode()
+    pos[0] += 1
     return next_character
 
 
+# byte values of the ASCII whitespace characters
+WHITESPACE = frozenset(byte for byte in range(128) if chr(byte).isspace())
+
+
 def get_next_non_whitespace_character(input_file):
     """Seek and return the next non-whitespace character in input_file."""
-    next_character = input_file.read(1)
-    if next_character.isspace():
-        next_character = get_next_non_whitespace_character(input_file)
-    return next_character
+    text, pos = input_file
+    end = len(text)
+    while pos[0] < end and text[pos[0]] in WHITESPACE:
+        pos[0] += 1
+    return get_next_character(input_file)
+
+
+NUMBER = re.compile(rb'[0-9]+')
+NAME = re.compile(rb'[A-Za-z][A-Za-z0-9]*')
+
+
+def get_next_token(input_file, pattern):
+    """Seek the next match of pattern in input_file.
+
+    Return the match (or None) and the character following it.
+    """
+    text, pos = input_file
+    match = pattern.search(text, pos[0])
+    if match is None:
+        pos[0] = len(text)
+        return [None, '']
+    pos[0] = match.end() + 1
+    return [match.group().decode(), text[match.end():pos[0]].decode()]
 
-def get_file_length(input_file):
-    pos = input_file.tell()
-    input_file.read()
-    length = input_file.tell()
-    input_file.seek(pos,0)
-    return length
 
 def get_next_number(input_file):
     """Seek the next number in input_file.
 
     Return the number (or None) and the next non-numeric character.
     """
-    length = get_file_length(input_file)
-    next_number = ''
-    next_digit = input_file.read(1)
-    for i in range(length):
-        if not next_digit.isdigit():
-            next_digit = input_file.read(1)
-        elif next_digit.isdigit():
-            break
-    for i in range(length):
-        next_number += next_digit
-        next_digit = input_file.read(1)
-        if not next_digit.isdigit():
-            break
-    if next_number == '':
-        return [None, '']
-    else:
-        return [int(next_number), next_digit]
+    next_number = get_next_token(input_file, NUMBER)
+    if next_number[0] is not None:
+        next_number[0] = int(next_number[0])
+    return next_number
+
 
 def get_next_name(input_file):
     """Seek the next name string in input_file.
 
     Return the name string (or None) and the next non-alphanumeric character.
     """
-    length = get_file_length(input_file)
-    next_name = ''
-    next_char = input_file.read(1)
-    for i in range(length):
-        if not next_char.isalpha():
-            next_char = input_file.read(1)
-        elif next_char.isalpha():
-            break
-    for i in range(length):
-        next_name += next_char
-        next_char = input_file.read(1)
-        if not next_char.isalnum():
-            break
-    if next_name == '':
-        return [None, '']
-    else:
-        return [next_name, next_char]
+    return get_next_token(input_file, NAME)
 
 def main():
     """Preliminary exercises for Part IIA Project GF2."""
@@ -93,6 +92,7 @@ def main():
         path = arguments[0]
         
         fo = open_file(path)
+        pos = fo[1]  # read position, reset to rewind the file
 
         print("\nNow reading file...")
         # Print out all the characters in the file, until the end of file
@@ -105,7 +105,7 @@ def main():
         print("\nNow skipping spaces...")
         # Print out all the characters in the file, without spaces
 
-        fo.seek(0,0)
+        pos[0] = 0
         char = ' '
         while char!='':
             char = get_next_non_whitespace_character(fo)
@@ -114,7 +114,7 @@ def main():
         print("\nNow reading numbers...")
         # Print out all the numbers in the file
 
-        fo.seek(0,0)
+        pos[0] = 0
         num = [None, ' ']
         while num[1] != '':
             num = get_next_number(fo)
@@ -124,7 +124,7 @@ def main():
         print("\nNow reading names...")
         # Print out all the names in the file
 
-        fo.seek(0,0)
+        pos[0] = 0
         new_name = [None, ' ']
         while new_name[1] != '':
             new_name = get_next_name(fo)
@@ -136,7 +136,7 @@ def main():
         name = MyNames()
         bad_name_ids = [name.lookup("Terrible"), name.lookup("Horrid"),
                          name.lookup("Ghastly"), name.lookup("Awful")]
-        fo.seek(0,0)
+        pos[0] = 0
         new_name = [None, ' ']
         while new_name[1] != '':
             new_name = get_next_name(fo)
@@ -24,34 +24,37 @@ class MyNames:
     """
 
     def __init__(self):
-        """Initialise the names list."""
+        """Initialise the names list and its name -> ID index."""
         self.names_list = []
+        self.name_to_id = {}
 
     def lookup(self, name_string):
         """Return the corresponding name ID for the given name_string.
 
         If the name string is not present in the names list, add it.
         """
-        if name_string in self.names_list:
-            return self.names_list.index(name_string)
-        else:
+        name_id = self.name_to_id.get(name_string)
+        if name_id is None:
+            name_id = len(self.names_list)
             self.names_list.append(name_string)
-            return len(self.names_list) - 1
+            self.name_to_id[name_string] = name_id
+        return name_id
 
     def get_string(self, name_id):
         """Return the corresponding name string for the given name_id.
 
         If the name ID is not a valid index into the names list, return None.
         """
-        if type(name_id) == str:
-            if not name_id.isnumeric():
-                print("String ID must be an integer" )
+        if not isinstance(name_id, int):  # ints skip the conversion
+            if isinstance(name_id, str):
+                if not name_id.isnumeric():
+                    print("String ID must be an integer")
+                    raise TypeError
+                name_id = float(name_id)
+            if name_id % 1 != 0:
+                print("String ID must be an integer")
                 raise TypeError
-            name_id = float(name_id)
-        if name_id%1 != 0:
-            print('String ID must be an integer')
-            raise TypeError
-        name_id = int(name_id)
+            name_id = int(name_id)
         if name_id < 0:
             print("String ID cannot be negative")
             raise ValueError
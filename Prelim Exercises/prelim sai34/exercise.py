@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 """Preliminary exercises for Part IIA Project GF2."""
+import mmap
+import re
 import sys
 from pathlib import Path
 
@@ -8,9 +10,16 @@ from mynames import MyNames
 
 
 def open_file(path):
-    """Open and return the file specified by path."""
+    """Read the file specified by path into memory.
+
+    Return the memory-mapped file bytes and a one-element list holding the
+    read position. The file is assumed to be ASCII.
+    """
     try:
-        return open(path, "r")
+        with open(path, "rb") as file:
+            if file.seek(0, 2) == 0:  # empty files cannot be mapped
+                return b"", [0]
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), [0]
     except Exception as e:
         print(f"ERROR: Could not open file {path}.")
         sys.exit()
@@ -18,15 +27,41 @@ def open_file(path):
 
 def get_next_character(input_file):
     """Read and return the next character in input_file."""
-    return input_file.read(1)
+    text, position = input_file
+    character = text[position[0]:position[0] + 1].decode()
+    position[0] += 1
+    return character
+
+
+# byte values of the ASCII whitespace characters
+WHITESPACE = frozenset(byte for byte in range(128) if chr(byte).isspace())
 
 
 def get_next_non_whitespace_character(input_file):
     """Seek and return the next non-whitespace character in input_file."""
-    character = input_file.read(1)
-    while character.isspace():
-        character = input_file.read(1)
-    return character
+    text, position = input_file
+    end = len(text)
+    while position[0] < end and text[position[0]] in WHITESPACE:
+        position[0] += 1
+    return get_next_character(input_file)
+
+
+NUMBER = re.compile(rb"[0-9]+")
+NAME = re.compile(rb"[A-Za-z][A-Za-z0-9]*")
+
+
+def get_next_token(input_file, pattern):
+    """Seek the next match of pattern in input_file.
+
+    Return the matched string (or None) and the character following it.
+    """
+    text, position = input_file
+    match = pattern.search(text, position[0])
+    if match is None:
+        position[0] = len(text)
+        return [None, ""]
+    position[0] = match.end() + 1
+    return [match.group().decode(), text[match.end():position[0]].decode()]
 
 
 def get_next_number(input_file):
@@ -34,19 +69,7 @@ def get_next_number(input_file):
 
     Return the number (or None) and the next non-numeric character.
     """
-    character = input_file.read(1)
-    while not character.isdigit():
-        if character == "":
-            return [None, ""]
-        character = input_file.read(1)
-    number = character
-    character = input_file.read(1)
-    while character.isdigit():
-        number += character
-        if character == "":
-            return [number, ""]
-        character = input_file.read(1)
-    return [number, character]
+    return get_next_token(input_file, NUMBER)
 
 
 def get_next_name(input_file):
@@ -54,19 +77,7 @@ def get_next_name(input_file):
 
     Return the name string (or None) and the next non-alphanumeric character.
     """
-    character = input_file.read(1)
-    while not character.isalpha():
-        if character == "":
-            return [None, ""]
-        character = input_file.read(1)
-    name = character
-    character = input_file.read(1)
-    while character.isalnum():
-        name += character
-        if character == "":
-            return [name, ""]
-        character = input_file.read(1)
-    return [name, character]
+    return get_next_token(input_file, NAME)
 
 
 def main():
@@ -84,25 +95,26 @@ def main():
         path = Path.cwd().joinpath(arguments[0])
         print(path)
         file = open_file(path)
+        position = file[1]  # read position, reset to rewind the file
 
         print("\n\nNow reading file...\n")
         # Print out all the characters in the file, until the end of file
-        character = file.read(1)
+        character = get_next_character(file)
         while character != "":
             print(character, sep='', end='')
             character = get_next_character(file)
 
         print("\n\nNow skipping spaces...\n")
         # Print out all the characters in the file, without spaces
-        file.seek(0, 0)
-        character = file.read(1)
+        position[0] = 0
+        character = get_next_character(file)
         while character != "":
             print(character, sep='', end='')
             character = get_next_non_whitespace_character(file)
 
         print("\n\nNow reading numbers...\n")
         # Print out all the numbers in the file
-        file.seek(0, 0)
+        position[0] = 0
         character = ""
         number = ""
         while number is not None:
@@ -111,7 +123,7 @@ def main():
 
         print("\n\nNow reading names...\n")
         # Print out all the names in the file
-        file.seek(0, 0)
+        position[0] = 0
         character = ""
         name = ""
         while name is not None:
@@ -123,7 +135,7 @@ def main():
         name = MyNames()
         bad_name_ids = [name.lookup("Terrible"), name.lookup("Horrid"),
                         name.lookup("Ghastly"), name.lookup("Awful")]
-        file.seek(0, 0)
+        position[0] = 0
         character = ""
         word = ""
         while word is not None:
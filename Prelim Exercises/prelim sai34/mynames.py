@@ -24,17 +24,21 @@ class MyNames:
     """
 
     def __init__(self):
-        """Initialise the names list."""
+        """Initialise the names list and its name -> ID index."""
         self.names_list = list()
+        self.name_to_id = dict()
 
     def lookup(self, name_string):
         """Return the corresponding name ID for the given name_string.
 
         If the name string is not present in the names list, add it.
         """
-        if name_string not in self.names_list:
+        name_id = self.name_to_id.get(name_string)
+        if name_id is None:
+            name_id = len(self.names_list)
             self.names_list.append(name_string)
-        return self.names_list.index(name_string)
+            self.name_to_id[name_string] = name_id
+        return name_id
 
     def get_string(self, name_id):
         """Return the corresponding name string for the given name_id.
@@ -1,4 +1,5 @@
 """Test the parser module."""
+import functools
 import pytest
 from pathlib import Path
 
@@ -10,6 +11,12 @@ from devices import Devices
 from monitors import Monitors
 
 
+# paths of test_files/test_parser1.N.txt, keyed by N
+PATHS = {
+    i: str(Path("test_files") / f"test_parser1.{i}.txt") for i in range(1, 28)
+}
+
+
 def new_parser(path):
     """Return a new parser instance"""
     names = Names()
@@ -21,108 +28,93 @@ def new_parser(path):
     return parser
 
 
+@functools.lru_cache(maxsize=None)
+def parse_file(path):
+    """Return the parse_network result and the parser used for path.
+
+    Each file is scanned and parsed once per session, however many tests
+    check it.
+    """
+    parser = new_parser(path)
+    return parser.parse_network(), parser
+
+
 def test_parser_returns_true():
-    parser = new_parser(str(Path("test_files/test_parser1.1.txt")))
-    assert parser.parse_network() == True
+    result = parse_file(PATHS[1])[0]
+    assert result == True
 
 
 @pytest.mark.parametrize(
-    "path", ["test_files/test_parser1.2.txt", 
-            "test_files/test_parser1.3.txt",
-            "test_files/test_parser1.4.txt",
-            "test_files/test_parser1.5.txt",
-            "test_files/test_parser1.6.txt",
-            "test_files/test_parser1.7.txt",
-            "test_files/test_parser1.8.txt",
-            "test_files/test_parser1.9.txt",
-            "test_files/test_parser1.10.txt",
-            "test_files/test_parser1.11.txt",
-            "test_files/test_parser1.12.txt",
-            "test_files/test_parser1.13.txt",
-            "test_files/test_parser1.14.txt",
-            "test_files/test_parser1.15.txt",
-            "test_files/test_parser1.16.txt",
-            "test_files/test_parser1.17.txt",
-            "test_files/test_parser1.18.txt",
-            "test_files/test_parser1.19.txt",
-            "test_files/test_parser1.20.txt",
-            "test_files/test_parser1.21.txt",
-            "test_files/test_parser1.22.txt",
-            "test_files/test_parser1.23.txt",
-            "test_files/test_parser1.24.txt",
-            "test_files/test_parser1.25.txt",
-            "test_files/test_parser1.26.txt",
-            "test_files/test_parser1.27.txt",]
+    "path", [PATHS[i] for i in range(2, 28)], ids=lambda path: Path(path).stem
 )
-
 def test_parser_returns_false(path):
-    parser = new_parser(str(Path(path)))
-    assert parser.parse_network() == False
+    result = parse_file(path)[0]
+    assert result == False
 
 
 def test_parser_missing_equals():       # - instead of = in DEVICES
-    parser = new_parser(str(Path("test_files/test_parser1.2.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[2])[0]
+    assert result == ""
 
 
 def test_parser_missing_dot():     # : instead of . in CONNECT
-    parser = new_parser(str(Path("test_files/test_parser1.3.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[3])[0]
+    assert result == ""
 
 
 def test_parser_missing_arrow():        # = instead of > in CONNECT
-    parser = new_parser(str(Path("test_files/test_parser1.4.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[4])[0]
+    assert result == ""
 
 
 def test_parser_missing_MONITOR():      # MONITOR misspelled
-    parser = new_parser(str(Path("test_files/test_parser1.5.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[5])[0]
+    assert result == ""
 
 
 def test_parser_missing_close_brace():      # missing brace end of CONNECT
-    parser = new_parser(str(Path("test_files/test_parser1.6.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[6])[0]
+    assert result == ""
 
 
 def test_parser_missing_open_brace():       # missing brace after CIRCUIT
-    parser = new_parser(str(Path("test_files/test_parser1.7.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[7])[0]
+    assert result == ""
 
 
 def test_parser_missing_END():      # END misspelled
-    parser = new_parser(str(Path("test_files/test_parser1.8.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[8])[0]
+    assert result == ""
 
 
 def test_parser_bad_name():     # 4SW4 as a name definition
-    parser = new_parser(str(Path("test_files/test_parser1.9.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[9])[0]
+    assert result == ""
 
 
 def test_parser_missing_semicolon():    # missing semicolon in MONITOR
-    parser = new_parser(str(Path("test_files/test_parser1.10.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[10])[0]
+    assert result == ""
 
 
 def test_parser_bad_clock_param():      # clock parameter is zero
-    parser = new_parser(str(Path("test_files/test_parser1.11.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[11])[0]
+    assert result == ""
 
 
 def test_parser_bad_switch_param():     # switch parameter is two
-    parser = new_parser(str(Path("test_files/test_parser1.12.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[12])[0]
+    assert result == ""
 
 
 def test_parser_bad_gate_param_0():       # and gate parameter is 0
-    parser = new_parser(str(Path("test_files/test_parser1.13.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[13])[0]
+    assert result == ""
 
 
 def test_parser_bad_device_definition():      # errors in switch definition
-    parser = new_parser(str(Path("test_files/test_parser1.14.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[14])[0]
+    assert result == ""
 
 
 def test_parser_xor_param():        # xor gate has a parameter
@@ -131,67 +123,49 @@ def test_parser_xor_param():        # xor gate has a parameter
 
 
 def test_parser_unsupported_device():   # declare unsupported device type
-    parser = new_parser(str(Path("test_files/test_parser1.16.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[16])[0]
+    assert result == ""
 
 
 def test_parser_no_gate_param1():    # forgot to initialise a gate parameter
-    parser = new_parser(str(Path("test_files/test_parser1.17.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[17])[0]
+    assert result == ""
 
 
 def test_parser_no_gate_param2():   # forgot to initialise a gate parameter
-    parser = new_parser(str(Path("test_files/test_parser1.18.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[18])[0]
+    assert result == ""
 
 
 def test_parser_switch_param_is_01():   # switch parameter is 01
-    parser = new_parser(str(Path("test_files/test_parser1.19.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[19])[0]
+    assert result == ""
 
 
 def test_parser_bad_pinname():   # and1 pinname is 1 instead of I1
-    parser = new_parser(str(Path("test_files/test_parser1.20.txt")))
-    assert parser.parse_network() == ""
+    result = parse_file(PATHS[20])[0]
+    assert result == ""
 
 
 def test_parser_multiple_errors():   # multiple minor syntax errors
-    parser = new_parser(str(Path("test_files/test_parser1.21.txt")))
-    assert parser.parse_network() == ""
+    result, parser = parse_file(PATHS[21])
+    assert result == ""
     assert parser.num_errors == 18
 
 
-def test_parser_no_braces():   # missing all braces
-    parser = new_parser(str(Path("test_files/test_parser1.22.txt")))
-    assert parser.parse_network() == ""
-    assert parser.num_errors == -1
-
-
-def test_parser_no_semicolons():   # missing all semicolons
-    parser = new_parser(str(Path("test_files/test_parser1.23.txt")))
-    assert parser.parse_network() == ""
-    assert parser.num_errors == -1
-
-
-def test_parser_no_commas():   # missing all commas
-    parser = new_parser(str(Path("test_files/test_parser1.24.txt")))
-    assert parser.parse_network() == ""
-    assert parser.num_errors == -1
-
-
-def test_parser_no_stopping_symbols():   # missing all stopping symbols
-    parser = new_parser(str(Path("test_files/test_parser1.25.txt")))
-    assert parser.parse_network() == ""
-    assert parser.num_errors == -1
-
-
-def test_parser_no_keywords():   # missing CIRCUIT, DEVICES etc
-    parser = new_parser(str(Path("test_files/test_parser1.26.txt")))
-    assert parser.parse_network() == ""
+@pytest.mark.parametrize(
+    "path",
+    [
+        PATHS[22],  # missing all braces
+        PATHS[23],  # missing all semicolons
+        PATHS[24],  # missing all commas
+        PATHS[25],  # missing all stopping symbols
+        PATHS[26],  # missing CIRCUIT, DEVICES etc
+        PATHS[27],  # missing all right braces
+    ],
+    ids=lambda path: Path(path).stem,
+)
+def test_parser_unrecoverable(path):
+    result, parser = parse_file(path)
+    assert result == ""
     assert parser.num_errors == -1
-
-
-def test_parser_no_right_brace():   # missing all right braces
-    parser = new_parser(str(Path("test_files/test_parser1.27.txt")))
-    assert parser.parse_network() == ""
-    assert parser.num_errors == -1
\ No newline at end of file
@@ -10,6 +10,74 @@ from devices import Devices
 from monitors import Monitors
 
 
+# expected stdout bytes for test_files/test_parser2.N.txt, keyed by "2.N"
+EXPECTED = {
+    "2.1": (
+        b"\n\nError on line 22:\n\n    or1.I1 > nand1.I2;\n                 "
+        b"  ^\n\nInput already connected\nError Count: 1\n"
+    ),
+    "2.2": (
+        b"\n\nError on line 21:\n\n    xor1 > nand1.I1, nor1;\n        "
+        b" ^\n\nOutput connected to output\nError Count: 1\n"
+    ),
+    "2.3": (
+        b"\n\nError on line 16:\n\nCONNECT\n^\n\nunconnected inputs:"
+        b" nand3.I1 xor2.I1 \nError Count: 1\n"
+    ),
+    "2.4": (
+        b"\n\nError on line 28:\n\n    and1 > dt1.DATA, nand2.I1;\n         "
+        b"                  ^\n\nInput already connected\nError Count: 1\n"
+    ),
+    "2.5": (
+        b"\n\nError on line 18:\n\n    SW1 > xor1.I1, or1.I1;\n         "
+        b" ^\n\nSpecified device does not exist\nError Count: 1\n"
+    ),
+    "2.6": (
+        b"\n\nError on line 27:\n\n    nand3 > and1.I3, nand4.I2;\n         "
+        b"        ^\n\nSpecified port does not exist\nError Count: 1\n"
+    ),
+    "2.7": (
+        b"\n\nError on line 11:\n\n    and1 = AND(17);\n              "
+        b" ^\n\nNumber of inputs must be between 1-16\nError Count: 1\n"
+    ),
+    "2.8": (
+        b"\n\nError on line 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames"
+        b" cannot"
+        b" be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR',"
+        b" 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR',"
+        b" 'DTYPE'\nError Count: 1\n"
+    ),
+    "2.9": (
+        b"\n\nError on line 31:\n\n    SW5 > dt1.CONNECT;\n             "
+        b" ^\n\nNames cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
+        b" 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR',"
+        b" 'XOR', 'DTYPE'\nError Count: 1\n"
+    ),
+    "2.10a": (
+        b"\n\nError on line 11:\n\n    and1 = AND(17);\n              "
+        b" ^\n\nNumber of inputs must be between 1-16\n\n\nError on line"
+        b" 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames cannot be Keywords:"
+        b" 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR', 'END','CLOCK',"
+        b" 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE'\nError"
+        b" Count: 2\n"
+    ),
+    "2.10b": (
+        b"\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
+        b" ^\n\nSpecified device does not exist\nError Count: 1\n"
+    ),
+    "2.11": (
+        b"\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
+        b" ^\n\nSpecified device does not exist\n\n\nError on line 24:\n\n  "
+        b"  nand1 < nand2.I1;\n          ^\n\nExpected '>'\nError Count: 2\n"
+    ),
+    "2.12": (
+        b"\n\nError on line 6:\n\n    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
+        b"                            ^\n\nExpected '=' or ','\nError"
+        b" Count: 1\n"
+    ),
+}
+
+
 def new_parser(path):
     """Return a new parser instance"""
     names = Names()
@@ -21,159 +89,96 @@ def new_parser(path):
     return parser
 
 
-def test_parser_input_to_input(capfd):
+def test_parser_input_to_input(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.1.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 22:\n\n    or1.I1 > nand1.I2;\n                 "
-        "  ^\n\nInput already connected\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.1"]
 
 
-def test_parser_output_to_output(capfd):
+def test_parser_output_to_output(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.2.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 21:\n\n    xor1 > nand1.I1, nor1;\n        "
-        " ^\n\nOutput connected to output\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.2"]
 
 
-def test_parser_input_not_connected(capfd):
+def test_parser_input_not_connected(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.3.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 16:\n\nCONNECT\n^\n\nunconnected inputs:"
-        " nand3.I1 xor2.I1 \nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.3"]
 
 
-def test_parser_multiple_connections_to_input(capfd):
+def test_parser_multiple_connections_to_input(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.4.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 28:\n\n    and1 > dt1.DATA, nand2.I1;\n         "
-        "                  ^\n\nInput already connected\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.4"]
 
 
-def test_parser_devicename_not_found(capfd):
+def test_parser_devicename_not_found(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.5.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 18:\n\n    SW1 > xor1.I1, or1.I1;\n         "
-        " ^\n\nSpecified device does not exist\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.5"]
 
 
-def test_parser_pinname_not_found(capfd):
+def test_parser_pinname_not_found(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.6.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 27:\n\n    nand3 > and1.I3, nand4.I2;\n         "
-        "        ^\n\nSpecified port does not exist\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.6"]
 
 
-def test_parser_too_many_inputs(capfd):
+def test_parser_too_many_inputs(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.7.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 11:\n\n    and1 = AND(17);\n              "
-        " ^\n\nNumber of inputs must be between 1-16\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.7"]
 
 
-def test_parser_devicename_keyword(capfd):
+def test_parser_devicename_keyword(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.8.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames"
-        " cannot"
-        " be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR',"
-        " 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR',"
-        " 'DTYPE'\nError Count: 1\n"
-    )
-
-
-def test_parser_pinname_keyword(capfd):
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.8"]
+
+
+def test_parser_pinname_keyword(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.9.txt")))
     assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 31:\n\n    SW5 > dt1.CONNECT;\n             "
-        " ^\n\nNames cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
-        " 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR',"
-        " 'XOR', 'DTYPE'\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.9"]
 
 
-def test_parser_semantic_semantic(capfd):
+def test_parser_semantic_semantic(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.10a.txt")))
     assert not parser.parse_network()
     assert parser.error_count == 2
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 11:\n\n    and1 = AND(17);\n              "
-        " ^\n\nNumber of inputs must be between 1-16\n\n\nError on line"
-        " 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames cannot be Keywords:"
-        " 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR', 'END','CLOCK',"
-        " 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'DTYPE'\nError"
-        " Count: 2\n"
-    )
-
-
-def test_parser_semantic_semantic2(capfd):
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.10a"]
+
+
+def test_parser_semantic_semantic2(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.10b.txt")))
     assert not parser.parse_network()
     assert parser.error_count == 1
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
-        " ^\n\nSpecified device does not exist\nError Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.10b"]
 
 
-def test_parser_semantic_syntax(capfd):
+def test_parser_semantic_syntax(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.11.txt")))
     assert not parser.parse_network()
     assert parser.error_count == 2
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
-        " ^\n\nSpecified device does not exist\n\n\nError on line 24:\n\n  "
-        "  nand1 < nand2.I1;\n          ^\n\nExpected '>'\nError Count: 2\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.11"]
 
 
-def test_parser_syntax_semantic(capfd):
+def test_parser_syntax_semantic(capfdbinary):
     parser = new_parser(str(Path("test_files/test_parser2.12.txt")))
     assert not parser.parse_network()
     assert parser.error_count == 1
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 6:\n\n    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
-        "                            ^\n\nExpected '=' or ','\nError"
-        " Count: 1\n"
-    )
+    output = capfdbinary.readouterr()[0]
+    assert output == EXPECTED["2.12"]
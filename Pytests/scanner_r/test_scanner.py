@@ -21,7 +21,6 @@ def test_scanner_spaces():
         assert symbol1.type == symbol2.type == symbol3.type      
         assert symbol1 != None
 
-test_scanner_spaces()
 
 def test_scanner_comments():
     names1 = Names()
@@ -71,8 +71,10 @@ def test_line_break():
     names2 = Names()
     scanner2 = Scanner(str(Path("test_files/test2b.txt")), names2)
     while True:
-        assert scanner1.get_symbol().string == scanner2.get_symbol.string()
-        if scanner1.get_symbol().string == "":
+        symbol1 = scanner1.get_symbol()
+        symbol2 = scanner2.get_symbol()
+        assert symbol1.string == symbol2.string
+        if symbol1.string == "":
             break
 
 
@@ -82,8 +84,10 @@ def test_complex_comments():
     names2 = Names()
     scanner2 = Scanner(str(Path("test_files/test4b.txt")), names2)
     while True:
-        assert scanner1.get_symbol().string == scanner2.get_symbol.string()
-        if scanner1.get_symbol().string == "":
+        symbol1 = scanner1.get_symbol()
+        symbol2 = scanner2.get_symbol()
+        assert symbol1.string == symbol2.string
+        if symbol1.string == "":
             break
 
 # def test_error_message():
@@ -0,0 +1,19 @@
+"""Shared fixtures for the Logic Simulator tests."""
+import pytest
+
+from names import Names
+from scanner import Scanner
+
+
+@pytest.fixture
+def scanner_factory():
+    """Return a function making a Scanner for a path.
+
+    Every Scanner is built with its own Names, so no test sees names or
+    scanner state left behind by another.
+    """
+
+    def make_scanner(path):
+        return Scanner(path, Names())
+
+    return make_scanner
@@ -18,7 +18,6 @@ import wx.glcanvas as wxcanvas
 from OpenGL import GL, GLUT
 
 from PIL import Image
-from PIL import ImageOps
 
 from names import Names
 from devices import Devices
@@ -28,6 +27,52 @@ from scanner import Scanner
 from parse import Parser
 from translate import Translator
 
+# heights of a signal trace above the signal's level at the start and the
+# end of a time step, for the LOW, HIGH, RISING and FALLING signal states
+TRACE_START = np.array([0, 20, 0, 20], dtype=np.float32)
+TRACE_END = np.array([0, 20, 20, 0], dtype=np.float32)
+
+
+def trace_vertices(signal, height, first=0):
+    """Return the vertices of the line strip tracing a signal.
+
+    Each time step that is LOW, HIGH, RISING or FALLING adds a vertex at its
+    start and one at its end. BLANK time steps add none, so the strip joins
+    the time steps either side of them.
+
+    Arguments:
+        signal -- signal values at each time step
+        height -- y coordinate of the signal's LOW level
+        first -- time step of the first signal value (default: {0})
+    """
+    signal = np.asarray(signal, dtype=np.int8)
+    steps = np.flatnonzero((signal >= 0) & (signal <= 3))
+    states = signal[steps]
+    steps += first
+    vertices = np.empty((2 * len(steps), 2), dtype=np.float32)
+    vertices[0::2, 0] = steps * 10 + 20
+    vertices[1::2, 0] = steps * 10 + 30
+    vertices[0::2, 1] = height + TRACE_START[states]
+    vertices[1::2, 1] = height + TRACE_END[states]
+    return vertices
+
+
+def tick_vertices(ticks, height):
+    """Return the vertices of the tick marks below a signal.
+
+    Each tick adds the two ends of a 5 unit vertical line, for GL_LINES.
+
+    Arguments:
+        ticks -- tick numbers, tick i marks time step 10 * i
+        height -- y coordinate of the signal's LOW level
+    """
+    ticks = np.asarray(ticks)
+    vertices = np.empty((2 * len(ticks), 2), dtype=np.float32)
+    vertices[:, 0] = np.repeat(ticks * 100 + 20, 2)
+    vertices[0::2, 1] = height
+    vertices[1::2, 1] = height - 5
+    return vertices
+
 
 class MyGLCanvas(wxcanvas.GLCanvas):
     """Handle all drawing operations.
@@ -44,16 +89,32 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     --------------
     init_gl(self): Configures the OpenGL context.
 
+    load_view(self): Loads the modelview matrix for the pan and zoom.
+
     render(self, names=None, signals=None, swap=True): Handles all drawing operations.
 
+    draw_vertices(self, vertices, mode): Draws an array of vertices.
+
     on_paint(self, event): Handles the paint event.
 
     on_size(self, event): Handles the canvas resize event.
 
     on_mouse(self, event): Handles mouse events.
 
+    render_idle(self, names, signals): Renders the signals once the current
+                                       frame is over.
+
+    on_refresh_timer(self, event): Repaints after a change of view or signals.
+
     render_text(self, text, x_pos, y_pos): Handles text drawing
                                            operations.
+
+    clear_text_lists(self): Deletes the display lists of rendered text.
+
+    set_color(self, red, green, blue): Sets the drawing color.
+
+    update_scrollbar(self, scrollbar, shown, settings): Updates a scrollbar
+                                                        if it has changed.
     """
 
     def __init__(self, parent, monitors):
@@ -82,6 +143,12 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.name_list = None
         self.signal_list = None
 
+        # display list drawing each line of text rendered so far
+        self.text_lists = {}
+
+        # current OpenGL drawing color, None until one is set
+        self.color = None
+
         self.parent = parent
 
         # initialise monitors
@@ -96,26 +163,39 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # Initialise variables for zooming
         self.zoom = 1
 
+        # repaint at most once a frame (16 ms) while panning and zooming
+        self.refresh_timer = wx.Timer(self)
+
         # Bind events to the canvas
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
+        self.Bind(wx.EVT_TIMER, self.on_refresh_timer, self.refresh_timer)
 
     def init_gl(self):
-        """Configure and initialise the OpenGL context."""
+        """Configure and initialise the OpenGL context.
+
+        Sets up the viewport and projection for the canvas size, which only
+        change when the canvas is resized.
+        """
         size = self.GetClientSize()
         self.SetCurrent(self.context)
         GL.glDrawBuffer(GL.GL_BACK)
         GL.glClearColor(1.0, 1.0, 1.0, 1.0)
+        self.color = None  # the drawing color has to be set again
         GL.glViewport(0, 0, size.width, size.height)
         GL.glMatrixMode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
         GL.glOrtho(0, size.width, 0, size.height, -1, 1)
         GL.glMatrixMode(GL.GL_MODELVIEW)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+
+    def load_view(self):
+        """Load the modelview matrix for the current pan and zoom."""
+        GL.glMatrixMode(GL.GL_MODELVIEW)
         GL.glLoadIdentity()
         GL.glTranslated(self.pan_x, self.pan_y, 0.0)
         GL.glScaled(self.zoom, self.zoom, self.zoom)
-        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
 
     def render(self, names=None, signals=None, swap=True):
         """Handle all drawing operations.
@@ -137,9 +217,11 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.limit_pan()
 
         if not self.init:
-            # Configure the viewport, modelview and projection matrices
+            # Configure the viewport and projection matrix
             self.init_gl()
             self.init = True
+        # Pan and zoom by the modelview matrix
+        self.load_view()
 
         # Clear everything
         GL.glClear(GL.GL_COLOR_BUFFER_BIT)
@@ -151,7 +233,35 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             n = len(signals)
 
             # set vertical spacing for signals on canvas
-            heights = np.linspace(30, 30 + 75 * (n - 1), n)
+            heights = 30.0 + 75.0 * np.arange(n)
+
+            # only draw the time steps and ticks in the visible window, with
+            # a step to spare at each end
+            left = -self.pan_x / self.zoom
+            right = (self.width - self.pan_x) / self.zoom
+            first_step = max(0, int(left - 30) // 10)
+            last_step = int(right - 20) // 10 + 1
+
+            # ticks every 10 timesteps, drawn for all signals in one call
+            # before the signal traces
+            tick_ranges = [
+                range(
+                    max(1, first_step // 10),
+                    min(len(signal) // 10, last_step // 10 + 1) + 1,
+                )
+                for signal in signals
+            ]
+            if signals:
+                self.set_color(0.0, 0.0, 0.0)  # ticks are black
+                self.draw_vertices(
+                    np.concatenate(
+                        [
+                            tick_vertices(ticks, height)
+                            for ticks, height in zip(tick_ranges, heights)
+                        ]
+                    ),
+                    GL.GL_LINES,
+                )
 
             # for each signal in the signal list
             for n, signal in enumerate(signals):
@@ -159,19 +269,11 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                     # draw 0 and 1 to show signal level
                     self.render_text("0", 10, heights[n] - 5)
                     self.render_text("1", 10, heights[n] + 15)
-                # draw ticks every 10 timesteps
-                for i in range(1, (len(signal)) // 10 + 1):
+                # label the ticks
+                for i in tick_ranges[n]:
                     self.render_text(
                         f"{int(i*10)}", i * 100 + 10, heights[n] - 16
                     )
-                    GL.glColor3f(0.0, 0.0, 0.0)  # ticks are black
-                    GL.glBegin(GL.GL_LINE_STRIP)
-                    x = (i * 100) + 20
-                    y = heights[n]
-                    y_next = heights[n] - 5
-                    GL.glVertex2f(x, y)
-                    GL.glVertex2f(x, y_next)
-                    GL.glEnd()
                 self.render_text(
                     names[n], -self.pan_x / self.zoom + 10, heights[n] + 35
                 )
@@ -183,35 +285,16 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                         "1", len(signal) * 10 + 30, heights[n] + 15
                     )
 
-                # draw signals
-                GL.glColor3f(0.0, 0.0, 1.0)  # signal trace is blue
-                GL.glBegin(GL.GL_LINE_STRIP)
-                for i, output in enumerate(signal):
-                    x = (i * 10) + 20
-                    x_next = (i * 10) + 30
-                    if output == 0:  # signal is low
-                        y = heights[n]
-                        y_next = heights[n]
-                        GL.glVertex2f(x, y)
-                        GL.glVertex2f(x_next, y_next)
-                    elif output == 1:  # signal is high
-                        y = heights[n] + 20
-                        y_next = heights[n] + 20
-                        GL.glVertex2f(x, y)
-                        GL.glVertex2f(x_next, y_next)
-                    elif output == 2:  # signal is rising
-                        y = heights[n]
-                        y_next = heights[n] + 20
-                        GL.glVertex2f(x, y)
-                        GL.glVertex2f(x_next, y_next)
-                    elif output == 3:  # signal is falling
-                        y = heights[n] + 20
-                        y_next = heights[n]
-                        GL.glVertex2f(x, y)
-                        GL.glVertex2f(x_next, y_next)
-                    elif output == 4:  # signal is blank
-                        pass
-                GL.glEnd()
+                # draw signals, all vertices of a trace in one call
+                self.set_color(0.0, 0.0, 1.0)  # signal trace is blue
+                vertices = trace_vertices(
+                    np.asarray(
+                        signal[first_step : last_step + 1], dtype=np.int8
+                    ),
+                    heights[n],
+                    first_step,
+                )
+                self.draw_vertices(vertices, GL.GL_LINE_STRIP)
 
         # We have been drawing to the back buffer, flush the graphics pipeline
         # and swap the back buffer to the front
@@ -219,6 +302,18 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             GL.glFlush()
             self.SwapBuffers()
 
+    def draw_vertices(self, vertices, mode):
+        """Draw an array of vertices with a single draw call.
+
+        Arguments:
+            vertices -- float32 array of the x and y coordinates of each vertex
+            mode -- OpenGL primitive joining the vertices, e.g. GL_LINES
+        """
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, vertices)
+        GL.glDrawArrays(mode, 0, len(vertices))
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+
     def on_paint(self, event):
         """Handle the paint event.
 
@@ -227,7 +322,7 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         """
         self.SetCurrent(self.context)
         if not self.init:
-            # Configure the viewport, modelview and projection matrices
+            # Configure the viewport and projection matrix
             self.init_gl()
             self.init = True
 
@@ -262,7 +357,6 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.pan_y -= event.GetY() - self.last_mouse_y
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
-            self.init = False
         if event.GetWheelRotation() < 0:
             self.zoom *= 1.0 + (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())
@@ -270,7 +364,6 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             # Adjust pan so as to zoom around the mouse position
             self.pan_x -= (self.zoom - old_zoom) * ox
             self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
         if event.GetWheelRotation() > 0:
             self.zoom /= 1.0 - (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())
@@ -278,23 +371,70 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             # Adjust pan so as to zoom around the mouse position
             self.pan_x -= (self.zoom - old_zoom) * ox
             self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
 
+        # the view changed, repaint once the current frame is over
+        view_changed = event.Dragging() or event.GetWheelRotation() != 0
+        if view_changed and not self.refresh_timer.IsRunning():
+            self.refresh_timer.StartOnce(16)
+
+    def render_idle(self, names, signals):
+        """Save the signals to draw and render them once the frame is over.
+
+        Renders requested together, e.g. by one event handler after
+        another, are coalesced into a single paint.
+
+        Arguments:
+            names -- names of monitor points
+            signals -- signals at the monitor points
+        """
+        self.name_list = names
+        self.signal_list = signals
+        if not self.refresh_timer.IsRunning():
+            self.refresh_timer.StartOnce(16)
+
+    def on_refresh_timer(self, event):
+        """Handle the refresh timer event.
+
+        Arguments:
+            event -- timer event after the view or the signals have changed
+        """
         self.Refresh()  # triggers the paint event
 
+    def set_color(self, red, green, blue):
+        """Set the OpenGL drawing color, if it is not already set."""
+        color = (red, green, blue)
+        if color != self.color:
+            GL.glColor3f(red, green, blue)
+            self.color = color
+
     def render_text(self, text, x_pos, y_pos):
         """Handle text drawing operations."""
-        GL.glColor3f(0.0, 0.0, 0.0)  # text is black
-        GL.glRasterPos2f(x_pos, y_pos)
+        self.set_color(0.0, 0.0, 0.0)  # text is black
         font = GLUT.GLUT_BITMAP_HELVETICA_12
 
-        # print characters in text
-        for character in text:
-            if character == "\n":
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
+        # print lines of text, each recorded in a display list the first
+        # time it is drawn and replayed after that
+        for line in text.split("\n"):
+            GL.glRasterPos2f(x_pos, y_pos)
+            text_list = self.text_lists.get(line)
+            if text_list is None:
+                text_list = GL.glGenLists(1)
+                GL.glNewList(text_list, GL.GL_COMPILE_AND_EXECUTE)
+                for character in line:
+                    GLUT.glutBitmapCharacter(font, ord(character))
+                GL.glEndList()
+                self.text_lists[line] = text_list
             else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+                GL.glCallList(text_list)
+            y_pos = y_pos - 20
+
+    def clear_text_lists(self):
+        """Delete the display lists recorded by render_text."""
+        if self.text_lists:
+            self.SetCurrent(self.context)
+            for text_list in self.text_lists.values():
+                GL.glDeleteLists(text_list, 1)
+            self.text_lists.clear()
 
     def set_max_dims(self, names, signals):
         """Find dimensions of full plot.
@@ -324,54 +464,68 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         """Limits x and y positions to sensible range."""
         if self.pan_x > 0:  # limit x to not go too far left
             self.pan_x = 0
-            self.init = False
         elif (
             self.width > self.max_x
         ):  # set x to zero if displaying full x-axis
             self.pan_x = 0
-            self.init = False
         elif (
             self.width - self.pan_x > self.max_x and self.width < self.max_x
         ):  # limit x to not go too far right
             self.pan_x = self.width - self.max_x
-            self.init = False
 
         if self.pan_y > 0:  # limit y to not go too far down
             self.pan_y = 0
-            self.init = False
         elif (
             self.height > self.max_y
         ):  # set y to zero if displaying full y-axis
             self.pan_y = 0
-            self.init = False
         elif (
             self.height - self.pan_y > self.max_y and self.height < self.max_y
         ):  # limit y to not go too far up
             self.pan_y = self.height - self.max_y
-            self.init = False
-
-        if (
-            self.width < self.max_x
-        ):  # show scrollbar if plot larger that visible x-axis
-            self.parent.horizontal_scrollbar.SetScrollbar(
-                -self.pan_x, self.width, self.max_x, self.width
-            )
-            self.parent.horizontal_scrollbar.Show()
-        else:
-            self.parent.horizontal_scrollbar.Hide()
 
-        if (
-            self.height < self.max_y
-        ):  # show scrollbar if plot larger that visible y-axis
-            self.parent.vertical_scrollbar.SetScrollbar(
+        # show scrollbar if plot larger that visible x-axis
+        self.update_scrollbar(
+            self.parent.horizontal_scrollbar,
+            self.width < self.max_x,
+            (-self.pan_x, self.width, self.max_x, self.width),
+        )
+        # show scrollbar if plot larger that visible y-axis
+        self.update_scrollbar(
+            self.parent.vertical_scrollbar,
+            self.height < self.max_y,
+            (
                 self.pan_y - self.height + self.max_y,
                 self.height,
                 self.max_y,
                 self.height,
+            ),
+        )
+
+    def update_scrollbar(self, scrollbar, shown, settings):
+        """Show or hide a scrollbar and set its position and size.
+
+        Only changes are passed on to the scrollbar, as each change makes
+        wx update the native widget.
+
+        Arguments:
+            scrollbar -- wx.ScrollBar to update
+            shown -- whether the scrollbar should be shown
+            settings -- thumb position, thumb size, range and page size
+        """
+        if shown:
+            current = (
+                scrollbar.GetThumbPosition(),
+                scrollbar.GetThumbSize(),
+                scrollbar.GetRange(),
+                scrollbar.GetPageSize(),
             )
-            self.parent.vertical_scrollbar.Show()
-        else:
-            self.parent.vertical_scrollbar.Hide()
+            if current != settings:
+                scrollbar.SetScrollbar(*settings)
+            if not scrollbar.IsShown():
+                scrollbar.Show()
+        elif scrollbar.IsShown():
+            scrollbar.Hide()
 
     def set_view(self, x=0, y=0, zoom=1):
         """Set view to given position.
@@ -381,7 +535,6 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             y -- y coordinate (default: {0})
             zoom -- zoom value (default: {1})
         """
-        self.init = False
         self.pan_x = x
         self.pan_y = y
         self.zoom = zoom
@@ -408,16 +561,21 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.init = False
             self.render(self.name_list, self.signal_list, swap=False)
 
-        # get pixel data
+        # get pixel data, as tightly packed RGB rows since the canvas is
+        # opaque
+        GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
         data = GL.glReadPixels(
             0,
             0,
             self.width,
             self.height,
-            GL.GL_RGBA,
+            GL.GL_RGB,
             GL.GL_UNSIGNED_BYTE,
         )
-        image = Image.frombytes("RGBA", (self.width, self.height), data)
+        # OpenGL rows run bottom to top, decode them in reverse order
+        image = Image.frombytes(
+            "RGB", (self.width, self.height), data, "raw", "RGB", 0, -1
+        )
 
         if full:  # go back to previous canvas layout
             self.pan_x = x
@@ -427,7 +585,7 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.SetSize((width, height))
             self.init = False
             self.render(self.name_list, self.signal_list, swap=False)
-        return ImageOps.flip(image)
+        return image
 
 
 class Gui(wx.Frame):
@@ -484,8 +642,10 @@ class Gui(wx.Frame):
         )
 
         # store which signals are monitored and not monitored
-        self.monitored_list = self.monitors.get_signal_names()[0]
-        self.not_monitored_list = self.monitors.get_signal_names()[1]
+        [
+            self.monitored_list,
+            self.not_monitored_list,
+        ] = self.monitors.get_signal_names()
 
         # list of all input names in network
         self.input_names_list = sorted(self.get_input_names())
@@ -495,6 +655,20 @@ class Gui(wx.Frame):
             self.monitored_list + self.not_monitored_list
         )
 
+        # [device_id, port_id] of each input and output, in the same order
+        # as the name lists
+        get_signal_ids = self.devices.get_signal_ids
+        self.input_ids_list = [
+            get_signal_ids(name) for name in self.input_names_list
+        ]
+        self.output_ids_list = [
+            get_signal_ids(name) for name in self.output_names_list
+        ]
+        # [device_id, port_id] of each output, by name
+        self.output_ids = dict(
+            zip(self.output_names_list, self.output_ids_list)
+        )
+
         # list of all connection names in network
         self.conn_name_list = self.get_conn_names()
 
@@ -507,10 +681,10 @@ class Gui(wx.Frame):
         ]
 
         # list of the states of the switches in the network
-        self.switch_states = [
+        self.switch_states = bytearray(
             self.devices.get_device(switch).switch_state
             for switch in self.switch_list
-        ]
+        )
 
         # store the signals and names that are being monitored
         self.signal_list = []
@@ -524,6 +698,7 @@ class Gui(wx.Frame):
         self.switch_to_toggle_selection = None  # index of switch to toggle
         self.input_for_swap = None  # input to swap connection for
         self.output_for_swap = None  # output to swap connection for
+        self.new_conn_ids = []  # output IDs of each new connection option
 
         # Configure the menu bar
         self.menuBar = wx.MenuBar()
@@ -774,13 +949,23 @@ class Gui(wx.Frame):
         Arguments:
             monitors_dict -- points to monitor
         """
-        for device_id, output_id in monitors_dict:
-            monitor_name = self.devices.get_signal_name(device_id, output_id)
-            self.name_list.append(monitor_name)  # add signal name to name list
-            signal = monitors_dict[(device_id, output_id)]
-            self.signal_list.append(signal)  # add signal values to signal list
+        # add signal names to name list
+        self.name_list.extend(
+            [
+                self.devices.get_signal_name(device_id, output_id)
+                for device_id, output_id in monitors_dict
+            ]
+        )
+        # add signal values to signal list, stored compactly for drawing
+        self.signal_list.extend(
+            [
+                np.asarray(signal, dtype=np.int8)
+                for signal in monitors_dict.values()
+            ]
+        )
 
-        self.canvas.render(self.name_list, self.signal_list)  # draw signals
+        # draw signals
+        self.canvas.render_idle(self.name_list, self.signal_list)
 
     def run_network(self, cycles):
         """Run the network for the specified number of simulation cycles.
@@ -828,20 +1013,20 @@ class Gui(wx.Frame):
         self.switch_to_toggle_selection = None
 
         # ensure switch box selection resets upon pressing run
-        for _ in range(len(self.switch_names)):
-            self.switch_box.Delete(0)
-        for i in range(len(self.switch_names)):
-            self.switch_box.Append(self.switch_names[i])
+        self.set_choices(self.switch_box, self.switch_names)
         self.switch_box.SetSelection(wx.NOT_FOUND)
 
         # run simulation for requested number of cycles
         if cycles is not None:  # if the number of cycles provided is valid
             if self.run_network(cycles):
                 self.cycles_completed += cycles
-            self.canvas.render(self.name_list, self.signal_list)
+            # scroll to the end of the new signals and render them once
+            self.canvas.name_list = self.name_list
+            self.canvas.signal_list = self.signal_list
+            self.canvas.set_max_dims(self.name_list, self.signal_list)
             self.canvas.pan_x = self.canvas.width - self.canvas.max_x
-            self.canvas.render(self.name_list, self.signal_list)
-            self.on_horizontal_scrollbar("")
+            self.canvas.limit_pan()
+            self.canvas.render_idle(self.name_list, self.signal_list)
 
     def on_restart_button(self, event):
         """Handle the event when the user clicks the restart button.
@@ -860,17 +1045,14 @@ class Gui(wx.Frame):
         self.switch_to_toggle_selection = None
 
         # ensure switch box selection resets upon pressing run
-        for _ in range(len(self.switch_names)):
-            self.switch_box.Delete(0)
-        for i in range(len(self.switch_names)):
-            self.switch_box.Append(self.switch_names[i])
+        self.set_choices(self.switch_box, self.switch_names)
         self.switch_box.SetSelection(wx.NOT_FOUND)
 
         # reset monitors and devices
         self.monitors.reset_monitors()
         self.devices.cold_startup()
         self.run_network(0)
-        self.canvas.render(self.name_list, self.signal_list)
+        self.canvas.render_idle(self.name_list, self.signal_list)
 
     def on_add_box(self, event):
         """Handle the event when user selects a monitor to add from the box.
@@ -919,7 +1101,7 @@ class Gui(wx.Frame):
         if (
             self.add_monitor != ""
         ):  # if the user has currently selected a monitor to add
-            new_monitor = self.devices.get_signal_ids(self.add_monitor)
+            new_monitor = self.output_ids[self.add_monitor]
             [device, port] = new_monitor
             monitor_error = self.monitors.make_monitor(
                 device, port, self.cycles_completed
@@ -928,24 +1110,22 @@ class Gui(wx.Frame):
                 self.signal_list = []
                 self.name_list = []
 
-                # remove selected monitor from choice of monitors to add
-                for _ in range(len(self.not_monitored_list)):
-                    self.add_box.Delete(0)
-                self.not_monitored_list = self.monitors.get_signal_names()[1]
-                for i in range(len(self.not_monitored_list)):
-                    self.add_box.Append(self.not_monitored_list[i])
-
-                # add selected monitor to choice of monitors to remove
-                for _ in range(len(self.monitored_list)):
-                    self.zap_box.Delete(0)
-                self.monitored_list = self.monitors.get_signal_names()[0]
-                for i in range(len(self.monitored_list)):
-                    self.zap_box.Append(self.monitored_list[i])
+                # move selected monitor from choice of monitors to add to
+                # choice of monitors to remove
+                [
+                    self.monitored_list,
+                    self.not_monitored_list,
+                ] = self.monitors.get_signal_names()
+                self.Freeze()
+                try:
+                    self.set_choices(self.add_box, self.not_monitored_list)
+                    self.set_choices(self.zap_box, self.monitored_list)
+                finally:
+                    self.Thaw()
 
                 # draw monitored signals
                 monitors_dict = self.monitors.monitors_dictionary
                 self.draw_signals(monitors_dict)
-        self.canvas.render(self.name_list, self.signal_list)
         self.add_monitor = ""
         self.add_box.SetSelection(wx.NOT_FOUND)
         self.zap_box.SetSelection(wx.NOT_FOUND)
@@ -957,30 +1137,28 @@ class Gui(wx.Frame):
             event -- pressing of button
         """
         if self.zap_monitor != "":
-            zap_monitor = self.devices.get_signal_ids(self.zap_monitor)
+            zap_monitor = self.output_ids[self.zap_monitor]
             [device, port] = zap_monitor
             if self.monitors.remove_monitor(device, port):
                 self.signal_list = []
                 self.name_list = []
 
-                # add selected monitor to choice of monitors to add
-                for _ in range(len(self.not_monitored_list)):
-                    self.add_box.Delete(0)
-                self.not_monitored_list = self.monitors.get_signal_names()[1]
-                for i in range(len(self.not_monitored_list)):
-                    self.add_box.Append(self.not_monitored_list[i])
-
-                # remove selected monitor from choice of monitors to remove
-                for _ in range(len(self.monitored_list)):
-                    self.zap_box.Delete(0)
-                self.monitored_list = self.monitors.get_signal_names()[0]
-                for i in range(len(self.monitored_list)):
-                    self.zap_box.Append(self.monitored_list[i])
+                # move selected monitor from choice of monitors to remove to
+                # choice of monitors to add
+                [
+                    self.monitored_list,
+                    self.not_monitored_list,
+                ] = self.monitors.get_signal_names()
+                self.Freeze()
+                try:
+                    self.set_choices(self.add_box, self.not_monitored_list)
+                    self.set_choices(self.zap_box, self.monitored_list)
+                finally:
+                    self.Thaw()
 
                 # draw monitored signals
                 monitors_dict = self.monitors.monitors_dictionary
                 self.draw_signals(monitors_dict)
-        self.canvas.render(self.name_list, self.signal_list)
         self.zap_monitor = ""
         self.add_box.SetSelection(wx.NOT_FOUND)
         self.zap_box.SetSelection(wx.NOT_FOUND)
@@ -994,17 +1172,12 @@ class Gui(wx.Frame):
         if self.toggle_0.GetValue():  # if 0 button is pressed
             self.toggle_1.SetValue(False)  # set 1 button to be unpressed
             if self.switch_to_toggle != "":  # if there is a switch selected
-                switch_id = self.names.query(
-                    self.switch_to_toggle
-                )  # get switch ID
-                if switch_id is not None:
-                    if self.devices.set_switch(
-                        switch_id, 0
-                    ):  # set switch to 0
-                        # update switch state in switch states list
-                        self.switch_states[self.switch_to_toggle_selection] = 0
-                    self.canvas.render(self.name_list, self.signal_list)
-            self.canvas.render(self.name_list, self.signal_list)
+                # the switch box lists the switches in switch_list order
+                switch_id = self.switch_list[self.switch_to_toggle_selection]
+                if self.devices.set_switch(switch_id, 0):  # set switch to 0
+                    # update switch state in switch states list
+                    self.switch_states[self.switch_to_toggle_selection] = 0
+                    self.canvas.render_idle(self.name_list, self.signal_list)
         else:  # 0 button is unpressed
             self.toggle_0.SetValue(True)  # keep 0 button to pressed
 
@@ -1017,47 +1190,40 @@ class Gui(wx.Frame):
         if self.toggle_1.GetValue():  # if 1 button is pressed
             self.toggle_0.SetValue(False)  # set 0 button to be unpressed
             if self.switch_to_toggle != "":  # if there is a switch selected
-                switch_id = self.names.query(
-                    self.switch_to_toggle
-                )  # get switch ID
-                if switch_id is not None:
-                    if self.devices.set_switch(
-                        switch_id, 1
-                    ):  # set switch to 1
-                        # update switch state in switch states list
-                        self.switch_states[self.switch_to_toggle_selection] = 1
-                    self.canvas.render(self.name_list, self.signal_list)
-            self.canvas.render(self.name_list, self.signal_list)
+                # the switch box lists the switches in switch_list order
+                switch_id = self.switch_list[self.switch_to_toggle_selection]
+                if self.devices.set_switch(switch_id, 1):  # set switch to 1
+                    # update switch state in switch states list
+                    self.switch_states[self.switch_to_toggle_selection] = 1
+                    self.canvas.render_idle(self.name_list, self.signal_list)
         else:  # 1 button is unpressed
             self.toggle_1.SetValue(True)  # keep 1 button to be pressed
 
     def on_swap_conn(self, event):
         """Handle the event when the user selects an input to alter connection for"""
-        _, text = self.swap_conn_box.GetString(
-            self.swap_conn_box.GetCurrentSelection()
-        ).split(" > ")
-        self.input_for_swap = self.devices.get_signal_ids(text)
-        options = self.get_new_conn_options(text)
+        # connections are listed in the same order as the inputs
+        selection = self.swap_conn_box.GetCurrentSelection()
+        self.input_for_swap = self.input_ids_list[selection]
+        options, self.new_conn_ids = self.get_new_conn_options(
+            self.input_names_list[selection], self.input_for_swap
+        )
         self.set_choices(self.new_conn_box, options)
 
-        new_conn_box = wx.Choice(self, wx.ID_ANY, choices=options)
-        self.new_conn_box.SetSize(new_conn_box.GetSize())
+        # size dropdown to fit its new choices
+        self.new_conn_box.SetSize(self.best_size(self.new_conn_box))
         self.new_conn_box.SetSelection(wx.NOT_FOUND)
-        self.new_conn_box.SetMaxSize((250, 10000))
-        new_conn_box.Destroy()
         self.Layout()
 
     def on_new_conn(self, event):
         """Handle the event when the user selects a new output to connect to an input"""
-        text, _ = self.new_conn_box.GetString(
-            self.new_conn_box.GetCurrentSelection()
-        ).split(" > ")
-        self.output_for_swap = self.devices.get_signal_ids(text)
+        selection = self.new_conn_box.GetCurrentSelection()
+        self.output_for_swap = self.new_conn_ids[selection]
 
     def on_replace_button(self, event):
         """Handle the event when the user presses the 'Replace connection' button"""
         message = ""
         undo = False
+        connections_changed = False
         if self.input_for_swap is not None:
             if self.output_for_swap is not None:
                 # get all necessary IDs
@@ -1077,29 +1243,31 @@ class Gui(wx.Frame):
                 )
                 # if connection was successfully replaced
                 if error == self.network.NO_ERROR:
-                    message += (
-                        self.translator.get_translation(
-                            "Successfully swapped connection into "
-                        )
-                        + self.devices.get_signal_name(
-                            first_dev_id, first_port_id
-                        )
-                        + self.translator.get_translation(
-                            ".\nConnection changed from "
-                        )
-                        + self.swap_conn_box.GetString(
-                            self.swap_conn_box.GetCurrentSelection()
-                        )
-                        + self.translator.get_translation(" to ")
-                        + self.new_conn_box.GetString(
-                            self.new_conn_box.GetCurrentSelection()
-                        )
-                        + self.translator.get_translation(".\n")
+                    translate = self.translator.get_translation
+                    message += "".join(
+                        [
+                            translate("Successfully swapped connection into "),
+                            self.devices.get_signal_name(
+                                first_dev_id, first_port_id
+                            ),
+                            translate(".\nConnection changed from "),
+                            self.swap_conn_box.GetString(
+                                self.swap_conn_box.GetCurrentSelection()
+                            ),
+                            translate(" to "),
+                            self.new_conn_box.GetString(
+                                self.new_conn_box.GetCurrentSelection()
+                            ),
+                            translate(".\n"),
+                        ]
                     )
                     undo = True
+                    connections_changed = True
                 else:
-                    message += self.translator.get_translation(
-                        "Error! Could not swap connection: "
+                    message += (
+                        self.translator.get_translation(
+                            "Error! Could not swap connection: "
+                        )
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1144,8 +1312,10 @@ class Gui(wx.Frame):
                         "Successfully undid connection swap.\n"
                     )
                 else:
-                    message += self.translator.get_translation(
-                        "Error! Could not undo connection swap: "
+                    message += (
+                        self.translator.get_translation(
+                            "Error! Could not undo connection swap: "
+                        )
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1168,10 +1338,17 @@ class Gui(wx.Frame):
         # reset variables and choice boxes
         self.input_for_swap = None
         self.output_for_swap = None
-        self.set_choices(self.swap_conn_box, self.get_conn_names())
-        self.set_choices(self.new_conn_box, [])
-        self.swap_conn_box.SetSelection(wx.NOT_FOUND)
-        self.new_conn_box.SetSelection(wx.NOT_FOUND)
+        if connections_changed:  # list connections again after a swap
+            self.conn_name_list = self.get_conn_names()
+        self.Freeze()
+        try:
+            self.set_choices(self.swap_conn_box, self.conn_name_list)
+            self.set_choices(self.new_conn_box, [])
+            self.new_conn_ids = []
+            self.swap_conn_box.SetSelection(wx.NOT_FOUND)
+            self.new_conn_box.SetSelection(wx.NOT_FOUND)
+        finally:
+            self.Thaw()
 
     def on_horizontal_scrollbar(self, event):
         """Change canvas position after horizontal scrollbar is moved.
@@ -1180,6 +1357,8 @@ class Gui(wx.Frame):
             event -- Event which caused change in scrollbar
         """
         x = -self.horizontal_scrollbar.GetThumbPosition()
+        if x == self.canvas.pan_x:  # no need to redraw an unchanged view
+            return
         self.canvas.set_view(x, self.canvas.pan_y, zoom=self.canvas.zoom)
 
     def on_vertical_scrollbar(self, event):
@@ -1193,6 +1372,8 @@ class Gui(wx.Frame):
             + self.canvas.height
             - self.canvas.max_y
         )
+        if y == self.canvas.pan_y:  # no need to redraw an unchanged view
+            return
         self.canvas.set_view(self.canvas.pan_x, y, zoom=self.canvas.zoom)
 
     def on_open_file(self, file=True):
@@ -1211,81 +1392,42 @@ class Gui(wx.Frame):
             wildcard="Text file (*.txt)|*.txt",
             style=wx.FD_OPEN | wx.FD_CHANGE_DIR | wx.FD_FILE_MUST_EXIST,
         )
-        # get action done by user
-        action = dialog.ShowModal()
-        if action == wx.ID_OK:  # if file selected
-            path = dialog.GetPath()
-            print(
-                self.translator.get_translation(
-                    "You chose the following file:"
-                )
-                + f' "{path}"'
-            )
-            if Path(path).suffix == ".txt":
-                # initialise network variables
-                names = Names()
-                devices = Devices(names)
-                network = Network(names, devices)
-                monitors = Monitors(names, devices, network)
-                scanner = Scanner(path, names)
-                parser = Parser(
-                    names, devices, network, monitors, scanner, self.translator
-                )
-                if parser.parse_network():
-                    # set up gui for new circuit
-                    self.names = names
-                    self.devices = devices
-                    self.network = network
-                    self.monitors = monitors
-                    self.scanner = scanner
-                    self.parser = parser
-                    self.new_file()
-                    dialog.Destroy()
-                else:
-                    # show errors
-                    parse_error_dialog = wx.lib.dialogs.ScrolledMessageDialog(
-                        self,
-                        parser.error_msg[2:],
+        try:
+            # ask again, reusing the dialog, until a file is loaded or the
+            # user gives up
+            while True:
+                # get action done by user
+                action = dialog.ShowModal()
+                if action == wx.ID_OK:  # if file selected
+                    path = dialog.GetPath()
+                    print(
                         self.translator.get_translation(
-                            "Could not parse file! (Error message below)"
-                            " Please select a different file."
-                        ),
-                    )
-                    txt_ctrl = parse_error_dialog.text
-                    txt_ctrl.SetFont(
-                        wx.Font(
-                            9,
-                            wx.FONTFAMILY_TELETYPE,
-                            wx.NORMAL,
-                            wx.NORMAL,
+                            "You chose the following file:"
                         )
+                        + f' "{path}"'
                     )
-                    parse_error_dialog.EnableCloseButton(False)
-                    parse_error_dialog.ShowModal()
-                    dialog.Destroy()
-                    self.on_open_file(file=file)
-            else:
-                if file is False:
-                    # require text file to be selected
-                    if (
-                        wx.MessageBox(
-                            self.translator.get_translation(
-                                "Could not load file! File type must be a text"
-                                " file (*.txt)\nWould you like to open a"
-                                " different file?"
-                            ),
-                            self.translator.get_translation(
-                                "Error opening file"
-                            ),
-                            wx.ICON_ERROR | wx.YES_NO,
-                        )
-                        == wx.YES
-                    ):
-                        dialog.Destroy()
-                        self.on_open_file(file=False)
-                    else:
+                    if Path(path).suffix == ".txt":
+                        if self.load_file(path):
+                            break
+                        continue
+                    if file is False:
+                        # require text file to be selected
+                        if (
+                            wx.MessageBox(
+                                self.translator.get_translation(
+                                    "Could not load file! File type must be a"
+                                    " text file (*.txt)\nWould you like to"
+                                    " open a different file?"
+                                ),
+                                self.translator.get_translation(
+                                    "Error opening file"
+                                ),
+                                wx.ICON_ERROR | wx.YES_NO,
+                            )
+                            == wx.YES
+                        ):
+                            continue
                         sys.exit()
-                else:
                     # exit without opening a file
                     wx.MessageBox(
                         self.translator.get_translation(
@@ -1295,28 +1437,79 @@ class Gui(wx.Frame):
                         self.translator.get_translation("Error opening file"),
                         wx.ICON_ERROR | wx.OK,
                     )
-                    dialog.Destroy()
-        elif action == wx.ID_CANCEL and file is False:
-            # require file to be selected
-            if (
-                wx.MessageBox(
-                    self.translator.get_translation(
-                        "This program requires you to load a circuit"
-                        " definition file.\nWould you like to select a file to"
-                        " load?"
-                    ),
-                    self.translator.get_translation("File required"),
-                    wx.ICON_ERROR | wx.YES_NO,
-                )
-                == wx.YES
-            ):
-                dialog.Destroy()
-                self.on_open_file(file=False)
-            else:
-                sys.exit()
-        else:
+                elif action == wx.ID_CANCEL and file is False:
+                    # require file to be selected
+                    if (
+                        wx.MessageBox(
+                            self.translator.get_translation(
+                                "This program requires you to load a circuit"
+                                " definition file.\nWould you like to select a"
+                                " file to load?"
+                            ),
+                            self.translator.get_translation("File required"),
+                            wx.ICON_ERROR | wx.YES_NO,
+                        )
+                        == wx.YES
+                    ):
+                        continue
+                    sys.exit()
+                break
+        finally:
             dialog.Destroy()
 
+    def load_file(self, path):
+        """Parse a circuit definition file and set up the GUI for it.
+
+        Show the parser errors instead if the file could not be parsed.
+
+        Arguments:
+            path -- path to circuit definition file
+
+        Returns: bool
+            True if the file was parsed and loaded, False otherwise
+        """
+        # initialise network variables
+        names = Names()
+        devices = Devices(names)
+        network = Network(names, devices)
+        monitors = Monitors(names, devices, network)
+        scanner = Scanner(path, names)
+        parser = Parser(
+            names, devices, network, monitors, scanner, self.translator
+        )
+        if not parser.parse_network():
+            # show errors
+            parse_error_dialog = wx.lib.dialogs.ScrolledMessageDialog(
+                self,
+                parser.error_msg[2:],
+                self.translator.get_translation(
+                    "Could not parse file! (Error message below)"
+                    " Please select a different file."
+                ),
+            )
+            txt_ctrl = parse_error_dialog.text
+            txt_ctrl.SetFont(
+                wx.Font(
+                    9,
+                    wx.FONTFAMILY_TELETYPE,
+                    wx.NORMAL,
+                    wx.NORMAL,
+                )
+            )
+            parse_error_dialog.EnableCloseButton(False)
+            parse_error_dialog.ShowModal()
+            parse_error_dialog.Destroy()
+            return False
+        # set up gui for new circuit
+        self.names = names
+        self.devices = devices
+        self.network = network
+        self.monitors = monitors
+        self.scanner = scanner
+        self.parser = parser
+        self.new_file()
+        return True
+
     def on_save_file(self, full=False):
         """Create and show the Save FileDialog.
 
@@ -1359,15 +1552,13 @@ class Gui(wx.Frame):
             List of strings containing the names of every input port
             in the network.
         """
-        input_names = []
-        device_ids = self.devices.find_devices()
-        for id in device_ids:
-            device = self.devices.get_device(id)
-            inputs = list(device.inputs)
-            for input in inputs:
-                name = self.devices.get_signal_name(id, input)
-                input_names.append(name)
-        return input_names
+        get_device = self.devices.get_device
+        get_signal_name = self.devices.get_signal_name
+        return [
+            get_signal_name(device_id, input_id)
+            for device_id in self.devices.find_devices()
+            for input_id in get_device(device_id).inputs
+        ]
 
     def get_conn_names(self):
         """Return a list with the names of each connection in the network.
@@ -1377,54 +1568,59 @@ class Gui(wx.Frame):
             connection in the network sorted alphabetically by input_name
         """
         conn_names = []
-        input_names = sorted(self.get_input_names())
-        for input_name in input_names:
-            device_id, input_id = self.devices.get_signal_ids(input_name)
-            conn_device, conn_output = self.network.get_connected_output(
+        get_connected_output = self.network.get_connected_output
+        get_signal_name = self.devices.get_signal_name
+        # the inputs are fixed for a network, so reuse the sorted input names
+        # new_file found
+        for input_name, [device_id, input_id] in zip(
+            self.input_names_list, self.input_ids_list
+        ):
+            conn_device, conn_output = get_connected_output(
                 device_id, input_id
             )
-            output_name = self.devices.get_signal_name(
-                conn_device, conn_output
-            )
-            conn_name = " > ".join([output_name, input_name])
-            conn_names.append(conn_name)
+            output_name = get_signal_name(conn_device, conn_output)
+            conn_names.append(" > ".join([output_name, input_name]))
         return conn_names
 
-    def get_new_conn_options(self, input_name):
-        """_summary_
+    def get_new_conn_options(self, input_name, input_ids):
+        """Return the outputs that could be connected into an input instead.
 
         Arguments:
             input_name -- string, the name of the input port selected to
                 change the connection to.
+            input_ids -- [device_id, port_id] of the input port
 
-        Returns: options
+        Returns: options, output_ids
             list of strings containing all possible new outputs to connect
-            into input_name in form 'new_output > input_name'
+            into input_name in form 'new_output > input_name', and a list of
+            the [device_id, port_id] of each of those outputs
         """
         options = []
-        device_id, input_id = self.devices.get_signal_ids(input_name)
-        current_conn, current_port = self.network.get_connected_output(
+        output_ids = []
+        device_id, input_id = input_ids
+        current_output = self.network.get_connected_output(
             device_id, input_id
         )
-        current_output_name = self.devices.get_signal_name(
-            current_conn, current_port
-        )
-        for output in self.output_names_list:
-            if output != current_output_name:
-                new_option = " > ".join([output, input_name])
-                options.append(new_option)
-        return options
+        for output, ids in zip(self.output_names_list, self.output_ids_list):
+            if tuple(ids) != current_output:
+                options.append(" > ".join([output, input_name]))
+                output_ids.append(ids)
+        return options, output_ids
 
     def new_file(self):
         """Set up GUI for new file."""
+        # free the display lists of the previous circuit's text
+        self.canvas.clear_text_lists()
         self.cycles_completed = 0  # number of simulation cycles completed
         self.num_cycles_requested = (
             10  # number of simulation cycles requested by user
         )
 
         # store which signals are monitored and not monitored
-        self.monitored_list = self.monitors.get_signal_names()[0]
-        self.not_monitored_list = self.monitors.get_signal_names()[1]
+        [
+            self.monitored_list,
+            self.not_monitored_list,
+        ] = self.monitors.get_signal_names()
 
         # list of all input names in network
         self.input_names_list = sorted(self.get_input_names())
@@ -1434,6 +1630,20 @@ class Gui(wx.Frame):
             self.monitored_list + self.not_monitored_list
         )
 
+        # [device_id, port_id] of each input and output, in the same order
+        # as the name lists
+        get_signal_ids = self.devices.get_signal_ids
+        self.input_ids_list = [
+            get_signal_ids(name) for name in self.input_names_list
+        ]
+        self.output_ids_list = [
+            get_signal_ids(name) for name in self.output_names_list
+        ]
+        # [device_id, port_id] of each output, by name
+        self.output_ids = dict(
+            zip(self.output_names_list, self.output_ids_list)
+        )
+
         # list of all connection names in network
         self.conn_name_list = self.get_conn_names()
 
@@ -1446,10 +1656,10 @@ class Gui(wx.Frame):
         ]
 
         # list of the states of the switches in the network
-        self.switch_states = [
+        self.switch_states = bytearray(
             self.devices.get_device(switch).switch_state
             for switch in self.switch_list
-        ]
+        )
 
         # store the signals and names that are being monitored
         self.signal_list = []
@@ -1463,59 +1673,60 @@ class Gui(wx.Frame):
         self.switch_to_toggle_selection = None  # index of switch to toggle
         self.input_for_swap = None  # input to swap connection for
         self.output_for_swap = None  # output to swap connection for
+        self.new_conn_ids = []  # output IDs of each new connection option
 
-        # Reset widget configuration
-        self.spin.SetValue("10")
-        self.set_choices(self.add_box, self.not_monitored_list)
-        self.set_choices(self.zap_box, self.monitored_list)
-        self.set_choices(self.switch_box, self.switch_names)
-        self.set_choices(self.swap_conn_box, self.conn_name_list)
-
-        add_box = wx.Choice(
-            self,
-            wx.ID_ANY,
-            choices=self.not_monitored_list,
-        )
-        zap_box = wx.Choice(
-            self,
-            wx.ID_ANY,
-            choices=self.monitored_list,
-        )
-        switch_box = wx.Choice(self, wx.ID_ANY, choices=self.switch_names)
-        swap_conn_box = wx.Choice(self, wx.ID_ANY, choices=self.conn_name_list)
-
-        # set dropdown size to match choices available
-        if add_box.GetSize()[0] < zap_box.GetSize()[0]:
-            self.add_box.SetSize(zap_box.GetSize())
-            self.zap_box.SetSize(zap_box.GetSize())
-        else:
-            self.add_box.SetSize(add_box.GetSize())
-            self.zap_box.SetSize(add_box.GetSize())
-
-        self.switch_box.SetSize(switch_box.GetSize())
-
-        self.swap_conn_box.SetSize(swap_conn_box.GetSize())
-
-        add_box.Destroy()
-        zap_box.Destroy()
-        switch_box.Destroy()
-        swap_conn_box.Destroy()
+        # batch the widget updates into a single repaint
+        self.Freeze()
+        try:
+            # Reset widget configuration
+            self.spin.SetValue("10")
+            self.set_choices(self.add_box, self.not_monitored_list)
+            self.set_choices(self.zap_box, self.monitored_list)
+            self.set_choices(self.switch_box, self.switch_names)
+            self.set_choices(self.swap_conn_box, self.conn_name_list)
+
+            # set dropdown size to match choices available
+            add_size = self.best_size(self.add_box)
+            zap_size = self.best_size(self.zap_box)
+            if add_size[0] < zap_size[0]:
+                self.add_box.SetSize(zap_size)
+                self.zap_box.SetSize(zap_size)
+            else:
+                self.add_box.SetSize(add_size)
+                self.zap_box.SetSize(add_size)
+
+            self.switch_box.SetSize(self.best_size(self.switch_box))
+
+            self.swap_conn_box.SetSize(self.best_size(self.swap_conn_box))
+
+            self.SetMinSize((900, 480))
+            self.add_box.SetMaxSize((155, 10000))
+            self.zap_box.SetMaxSize((155, 10000))
+            self.switch_box.SetMaxSize((250, 10000))
+            self.swap_conn_box.SetMaxSize((250, 10000))
+            self.new_conn_box.SetMaxSize((250, 10000))
+
+            # set dropdowns to be empty
+            self.add_box.SetSelection(wx.NOT_FOUND)
+            self.zap_box.SetSelection(wx.NOT_FOUND)
+            self.switch_box.SetSelection(wx.NOT_FOUND)
+            self.swap_conn_box.SetSelection(wx.NOT_FOUND)
+            self.new_conn_box.SetSelection(wx.NOT_FOUND)
+        finally:
+            self.Thaw()
+            self.Layout()
 
-        self.SetMinSize((900, 480))
-        self.add_box.SetMaxSize((155, 10000))
-        self.zap_box.SetMaxSize((155, 10000))
-        self.switch_box.SetMaxSize((250, 10000))
-        self.swap_conn_box.SetMaxSize((250, 10000))
-        self.new_conn_box.SetMaxSize((250, 10000))
+        self.draw_signals(self.monitors.monitors_dictionary)
 
-        # set dropdowns to be empty
-        self.add_box.SetSelection(wx.NOT_FOUND)
-        self.zap_box.SetSelection(wx.NOT_FOUND)
-        self.switch_box.SetSelection(wx.NOT_FOUND)
-        self.swap_conn_box.SetSelection(wx.NOT_FOUND)
-        self.new_conn_box.SetSelection(wx.NOT_FOUND)
+    def best_size(self, choicebox):
+        """Return the size that fits the current choices in a dropdown.
 
-        self.draw_signals(self.monitors.monitors_dictionary)
+        Arguments:
+            choicebox -- wx.Choice widget
+        """
+        # the cached best size is out of date once the choices change
+        choicebox.InvalidateBestSize()
+        return choicebox.GetBestSize()
 
     def set_choices(self, choicebox, choices):
         """Set choices in dropdowns.
@@ -1524,9 +1735,8 @@ class Gui(wx.Frame):
             choicebox -- wx.Choice widget
             choices -- list of strings to add as choices
         """
-        choicebox.Clear()
-        for item in choices:
-            choicebox.Append(item)
+        # replace all the items in one update of the widget
+        choicebox.Set(choices)
 
     def choose_language(self):
         """Creates dialog box to allow language choice."""
@@ -13,8 +13,6 @@ Graphical user interface: logsim.py <file path>
 import getopt
 import sys
 
-import wx
-
 from names import Names
 from devices import Devices
 from network import Network
@@ -22,8 +20,6 @@ from monitors import Monitors
 from scanner import Scanner
 from parse import Parser
 from translate import Translator
-from userint import UserInterface
-from gui import Gui
 
 
 def main(arg_list):
@@ -45,6 +41,18 @@ def main(arg_list):
         print(usage_message)
         sys.exit()
 
+    # handle help and argument errors before building the simulator
+    if "-h" in [option for option, path in options]:  # print usage message
+        print(usage_message)
+        sys.exit()
+    if not options and len(arguments) > 1:  # too many arguments for the GUI
+        print(
+            "Error: When using GUI, do not give any arguments except"
+            " optional language ID.\n"
+        )
+        print(usage_message)
+        sys.exit()
+
     # Initialise instances of the four inner simulator classes
     names = Names()
     devices = Devices(names)
@@ -52,10 +60,7 @@ def main(arg_list):
     monitors = Monitors(names, devices, network)
 
     for option, path in options:
-        if option == "-h":  # print the usage message
-            print(usage_message)
-            sys.exit()
-        elif (
+        if (
             option == "-c" and len(arguments) <= 1
         ):  # use the command line user interface
             if len(arguments) == 1:
@@ -68,28 +73,25 @@ def main(arg_list):
                 names, devices, network, monitors, scanner, translator
             )
             if parser.parse_network():
+                from userint import UserInterface
+
                 # Initialise an instance of the userint.UserInterface() class
                 userint = UserInterface(names, devices, network, monitors)
                 userint.command_interface()
 
     if not options:  # no option given, use the graphical user interface
+        if len(arguments) == 1:  # language choice
+            [lang] = arguments
+            translator = Translator(lang=lang)
+        else:
+            translator = Translator()
+        # wxPython is only loaded when the GUI is used
+        import wx
+        from gui import Gui
 
-        if len(arguments) <= 1:  # no argument or language choice
-            if len(arguments) == 1:
-                [lang] = arguments
-                translator = Translator(lang=lang)
-            else:
-                translator = Translator()
-            app = wx.App()
-            gui = Gui("Logic Simulator", "", names, devices, network, monitors)
-            app.MainLoop()
-        elif len(arguments) > 1:  # too many arguments
-            print(
-                "Error: When using GUI, do not give any arguments except"
-                " optional language ID.\n"
-            )
-            print(usage_message)
-            sys.exit()
+        app = wx.App()
+        gui = Gui("Logic Simulator", "", names, devices, network, monitors)
+        app.MainLoop()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ Classes
 -------
 Names - maps variable names and string names to unique integers.
 """
+import sys
 
 
 class Names:
@@ -41,6 +42,7 @@ class Names:
         """Initialise names list."""
         self.error_code_count = 0  # how many error codes have been declared
         self.names_list = []       # initialise the empty names list
+        self.names_dict = {}       # maps each name string to its name ID
 
     def unique_error_codes(self, num_error_codes):
         """Return a list of unique integer error codes."""
@@ -55,23 +57,27 @@ class Names:
 
         If the name string is not present in the names list, return None.
         """
-        if name_string in self.names_list:
-            return self.names_list.index(name_string)   # name_id is the index
-        else:                                           # of the string in the
-            return None                                 # name list
+        # name_id is the index of the string in the name list
+        return self.names_dict.get(name_string)
 
     def lookup(self, name_string_list):
         """Return a list of name IDs for each name string in name_string_list.
 
         If the name string is not present in the names list, add it.
         """
-        name_id_list = []       # initialise list of name IDs
-        for name_string in name_string_list:
-            if name_string in self.names_list:
-                name_id_list.append(self.names_list.index(name_string))
-            else:
-                self.names_list.append(name_string)
-                name_id_list.append(len(self.names_list) - 1)
+        # preallocate the list of name IDs, filled in place below
+        name_id_list = [0] * len(name_string_list)
+        names_dict = self.names_dict
+        names_list = self.names_list
+        for i, name_string in enumerate(name_string_list):
+            name_id = names_dict.get(name_string)
+            if name_id is None:
+                # store one shared copy of each name string
+                name_string = sys.intern(name_string)
+                name_id = len(names_list)
+                names_list.append(name_string)
+                names_dict[name_string] = name_id
+            name_id_list[i] = name_id
         return name_id_list
 
     def get_name_string(self, name_id):
@@ -79,15 +85,16 @@ class Names:
 
         If the name_id is not an index in the names list, return None.
         """
-        if type(name_id) == str:
-            if not name_id.isnumeric():
+        if not isinstance(name_id, int):  # ints skip the conversion
+            if isinstance(name_id, str):
+                if not name_id.isnumeric():
+                    print("String ID must be an integer")
+                    raise TypeError
+                name_id = float(name_id)
+            if name_id % 1 != 0:
                 print("String ID must be an integer")
                 raise TypeError
-            name_id = float(name_id)
-        if name_id % 1 != 0:
-            print('String ID must be an integer')
-            raise TypeError
-        name_id = int(name_id)
+            name_id = int(name_id)
         if name_id < 0:
             print("String ID cannot be negative")
             raise ValueError
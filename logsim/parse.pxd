@@ -0,0 +1,33 @@
+# Declarations for compiling parse.py with Cython in pure Python mode:
+#
+#     cythonize -i -3 parse.py
+#
+# Parser becomes an extension type with typed attribute slots. Without the
+# compiled module, parse.py runs unchanged.
+
+cdef class Parser:
+    cdef object __names
+    cdef object __devices
+    cdef object __monitors
+    cdef public object network
+    cdef public object scanner
+    cdef public object translator
+    cdef public object get_symbol
+    cdef public object symbol
+    cdef public object check_symbol
+    cdef public object cur_arrow
+    cdef public object cur_attribute
+    cdef public list cur_device_name_list
+    cdef public list cur_pin_name_list
+    cdef public Py_ssize_t CIRCUIT_ID
+    cdef public Py_ssize_t DEVICES_ID
+    cdef public Py_ssize_t CONNECT_ID
+    cdef public Py_ssize_t MONITOR_ID
+    cdef public Py_ssize_t END_ID
+    cdef public dict device_dispatch
+    cdef public dict stopping_symbol_types
+    cdef public str error_msg
+    cdef public list pending_errors
+    cdef public bint error_
+    cdef public bint skip
+    cdef public Py_ssize_t error_count
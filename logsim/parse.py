@@ -9,8 +9,40 @@ Classes
 Parser - parses the definition file and builds the logic network.
 """
 
+import functools
 import sys
-from scanner import Symbol
+from scanner import (
+    ARROW,
+    BRACE_LEFT,
+    BRACE_RIGHT,
+    COMMA,
+    DOT,
+    EOF,
+    EQUALS,
+    KEYWORD,
+    NAME,
+    NUMBER,
+    PARENTHESIS_LEFT,
+    PARENTHESIS_RIGHT,
+    SEMICOLON,
+    Symbol,
+)
+
+# keyword error messages, kept exactly as users have always seen them
+NAME_KEYWORD_ERROR = (
+    "Names cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR',"
+    " 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'NOT',"
+    " 'DTYPE'"
+)
+DEVICE_NAME_KEYWORD_ERROR = (
+    "Device names cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
+    " 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR',"
+    " 'NOT' 'DTYPE'"
+)
+# symbol types that end a device, connection or monitor list
+LIST_END_TYPES = frozenset((BRACE_RIGHT, EOF))
+# stands in for the pin of a point with no '.pin' suffix, never modified
+NO_PIN_SYMBOL = Symbol()
 
 
 class Parser:
@@ -35,6 +67,9 @@ class Parser:
     --------------
     parse_network(self): Parses the circuit definition file.
 
+    print_pending_errors(self): Prints the errors recorded so far and adds
+                                them to the error message.
+
     Private methods
     --------------
     __circuit(self): Parse circuit syntax.
@@ -43,21 +78,15 @@ class Parser:
 
     __device(self): Parse device definition
 
-    __devicename(self): Parse name of device
+    __device_ids(self): Look up the IDs of the current device names
 
-    __name(self, type): Parse a name
+    __devicename(self): Parse name of device
 
     __clock(self): Parse CLOCK definition
 
     __switch(self): Parse SWITCH definition
 
-    __And(self): Parse AND definition
-
-    __nand(self): Parse NAND definition 
-
-    __nor(self): Parse NOR definition 
-
-    __oor(self): Parse OR definition 
+    __gate_inputs(self, gate_name): Parse number of inputs of a gate
 
     __connectionlist(self): Parse list of connections
 
@@ -71,9 +100,38 @@ class Parser:
 
     __monitor(self): Parse a monitor
 
-    __error(self, message, stopping_symbol=";", symbol=None): Produce an error message
+    __error(self, message, stopping_symbol=";", symbol=None): Record an error message
     """
 
+    # fixed attribute slots, also declared in parse.pxd for the Cython build
+    __slots__ = (
+        "__names",
+        "__devices",
+        "__monitors",
+        "network",
+        "scanner",
+        "translator",
+        "get_symbol",
+        "symbol",
+        "check_symbol",
+        "cur_arrow",
+        "cur_attribute",
+        "cur_device_name_list",
+        "cur_pin_name_list",
+        "CIRCUIT_ID",
+        "DEVICES_ID",
+        "CONNECT_ID",
+        "MONITOR_ID",
+        "END_ID",
+        "device_dispatch",
+        "stopping_symbol_types",
+        "error_msg",
+        "pending_errors",
+        "error_",
+        "skip",
+        "error_count",
+    )
+
     def __init__(self, names, devices, network, monitors, scanner, translator):
         """Initialise constants."""
         self.__names = names
@@ -82,46 +140,106 @@ class Parser:
         self.__monitors = monitors
         self.scanner = scanner
         self.translator = translator
-        self.symbol = self.scanner.get_symbol()
+        # (symbol, message) pairs, formatted when parsing finishes
+        self.pending_errors = []
+        self.error_msg = ""
+        # keep the errors in file order when the scanner reports one
+        scanner.before_error = self.print_pending_errors
+        # bound once, as the parser advances through it on every symbol
+        self.get_symbol = scanner.get_symbol
+        self.symbol = self.get_symbol()
         self.error_ = False
         self.error_count = 0
         self.skip = False
         self.cur_attribute = None
-        self.error_msg = ""
+        # name symbols of the current definition, cleared and reused
+        self.cur_device_name_list = []
+        self.cur_pin_name_list = []
+        # name IDs of the keywords the parser checks for
+        self.CIRCUIT_ID = scanner.CIRCUIT_ID
+        self.DEVICES_ID = scanner.DEVICES_ID
+        self.CONNECT_ID = scanner.CONNECT_ID
+        self.MONITOR_ID = scanner.MONITOR_ID
+        self.END_ID = scanner.END_ID
+        # device keyword ID -> (property parser, device maker, the maker's
+        # arguments after the device ID); the parsed property is appended
+        self.device_dispatch = {
+            scanner.CLOCK_ID: (self.__clock, devices.make_clock, ()),
+            scanner.SWITCH_ID: (self.__switch, devices.make_switch, ()),
+            scanner.AND_ID: (
+                functools.partial(self.__gate_inputs, "AND"),
+                devices.make_gate,
+                (devices.AND,),
+            ),
+            scanner.NAND_ID: (
+                functools.partial(self.__gate_inputs, "NAND"),
+                devices.make_gate,
+                (devices.NAND,),
+            ),
+            scanner.OR_ID: (
+                functools.partial(self.__gate_inputs, "OR"),
+                devices.make_gate,
+                (devices.OR,),
+            ),
+            scanner.NOR_ID: (
+                functools.partial(self.__gate_inputs, "NOR"),
+                devices.make_gate,
+                (devices.NOR,),
+            ),
+            scanner.DTYPE_ID: (None, devices.make_d_type, ()),
+            scanner.XOR_ID: (None, devices.make_gate, (devices.XOR, 2)),
+            scanner.NOT_ID: (None, devices.make_gate, (devices.NOT, 1)),
+        }
+        # symbol types of the stopping symbols that __error resumes from
+        self.stopping_symbol_types = {
+            ";": SEMICOLON,
+            "{": BRACE_LEFT,
+        }
 
     def parse_network(self):
         """Parse the circuit definition file."""
         self.__circuit()
         if (
-            self.symbol.type == self.scanner.KEYWORD
-            and self.symbol.id == self.scanner.END_ID
+            self.symbol.type == KEYWORD
+            and self.symbol.id == self.END_ID
         ):
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected 'END'")
+        self.print_pending_errors()
         self.error_msg += "\n\n" + f"Error Count: {self.error_count}"
         print(f"Error Count: {self.error_count}")
         return not self.error_
 
+    def print_pending_errors(self):
+        """Print the errors recorded so far and add them to error_msg."""
+        # join the messages once rather than growing error_msg per error
+        print_error = self.scanner.print_error
+        self.error_msg += "".join(
+            "\n\n" + print_error(symbol, message)
+            for symbol, message in self.pending_errors
+        )
+        self.pending_errors.clear()
+
     def __circuit(self):
         """Parse circuit syntax."""
         if (
-            self.symbol.type == self.scanner.KEYWORD
-            and self.symbol.id == self.scanner.CIRCUIT_ID
+            self.symbol.type == KEYWORD
+            and self.symbol.id == self.CIRCUIT_ID
         ):
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected 'CIRCUIT'", "{")
-        if self.symbol.type == self.scanner.BRACE_LEFT:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == BRACE_LEFT:
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected '{'", None)
 
         self.__devicelist()
         self.__connectionlist()
         self.__monitorlist()
-        if self.symbol.type == self.scanner.BRACE_RIGHT:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == BRACE_RIGHT:
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected '}'", None)
 
@@ -129,26 +247,23 @@ class Parser:
         """Parse device list syntax."""
         right_brace = True
         if (
-            self.symbol.type == self.scanner.KEYWORD
-            and self.symbol.id == self.scanner.DEVICES_ID
+            self.symbol.type == KEYWORD
+            and self.symbol.id == self.DEVICES_ID
         ):
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected 'DEVICES'", "{")
-        if self.symbol.type == self.scanner.BRACE_LEFT:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == BRACE_LEFT:
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected '{'", None)
 
         self.__device()
-        while (
-            self.symbol.type != self.scanner.BRACE_RIGHT
-            and self.symbol.type != self.scanner.EOF
-        ):
+        while self.symbol.type not in LIST_END_TYPES:
             # Check for CONNECT to detect missing right brace
-            if self.symbol.id == self.scanner.CONNECT_ID:
-                self.check_symbol = self.scanner.get_symbol()
-                if self.check_symbol.type == self.scanner.BRACE_LEFT:
+            if self.symbol.id == self.CONNECT_ID:
+                self.check_symbol = self.get_symbol()
+                if self.check_symbol.type == BRACE_LEFT:
                     self.skip = True
                     self.__error("Expected '}'", None)
                     self.symbol = self.check_symbol
@@ -156,161 +271,36 @@ class Parser:
                     break
                 # Or used CONNECT as name
                 else:
-                    self.__error(
-                        "Device names cannot be Keywords: 'CIRCUIT',"
-                        " 'DEVICES', 'CONNECT', 'MONITOR', 'END','CLOCK',"
-                        " 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'NOT' 'DTYPE'"
-                    )
-                    self.symbol = self.scanner.get_symbol()
+                    self.__error(DEVICE_NAME_KEYWORD_ERROR)
+                    self.symbol = self.get_symbol()
 
             self.__device()
         if right_brace:
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
 
     def __device(self):
         """Parse device syntax."""
-        self.cur_device_name_list = []
+        self.cur_device_name_list.clear()
         if self.__devicename():
-            valid_device_list = True
-            while (
-                self.symbol.type == self.scanner.COMMA
-                and self.symbol.type != self.scanner.EOF
-                and valid_device_list
-            ):
-                self.symbol = self.scanner.get_symbol()
-                valid_device_list = self.__devicename()
-            if valid_device_list:
-                if self.symbol.type == self.scanner.EQUALS:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.id == self.scanner.CLOCK_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__clock()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_clock(
-                                    device_id, self.cur_attribute
-                                )
-                    elif self.symbol.id == self.scanner.SWITCH_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__switch()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_switch(
-                                    device_id, self.cur_attribute
-                                )
-                    elif self.symbol.id == self.scanner.AND_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__And()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id,
-                                    self.__devices.AND,
-                                    self.cur_attribute,
-                                )
-                    elif self.symbol.id == self.scanner.NAND_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__nand()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id,
-                                    self.__devices.NAND,
-                                    self.cur_attribute,
-                                )
-                    elif self.symbol.id == self.scanner.OR_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__oor()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id,
-                                    self.__devices.OR,
-                                    self.cur_attribute,
-                                )
-                    elif self.symbol.id == self.scanner.NOR_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        self.__nor()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id,
-                                    self.__devices.NOR,
-                                    self.cur_attribute,
-                                )
-                    elif self.symbol.id == self.scanner.DTYPE_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_d_type(device_id)
-                    elif self.symbol.id == self.scanner.XOR_ID:
-                        self.symbol = self.scanner.get_symbol()
-                        if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id, self.__devices.XOR, 2
-                                )
-                    elif self.symbol.id == self.scanner.NOT_ID:
-                        self.symbol = self.scanner.get_symbol()
+            # a single device goes straight to the else clause, a device
+            # list breaks out if a name is invalid
+            while self.symbol.type == COMMA:
+                self.symbol = self.get_symbol()
+                if not self.__devicename():
+                    break
+            else:
+                if self.symbol.type == EQUALS:
+                    self.symbol = self.get_symbol()
+                    device_entry = self.device_dispatch.get(self.symbol.id)
+                    if device_entry is not None:
+                        parse_property, make_device, arguments = device_entry
+                        self.symbol = self.get_symbol()
+                        if parse_property is not None:
+                            parse_property()
+                            arguments += (self.cur_attribute,)
                         if not self.error_:
-                            device_ids = self.__names.lookup(
-                                [
-                                    dev.string
-                                    for dev in self.cur_device_name_list
-                                ]
-                            )
-                            for device_id in device_ids:
-                                self.__devices.make_gate(
-                                    device_id, self.__devices.NOT, 1
-                                )
+                            for device_id in self.__device_ids():
+                                make_device(device_id, *arguments)
                     else:
                         self.__error(
                             "Not a supported device, supported devices: CLOCK,"
@@ -319,59 +309,43 @@ class Parser:
                 else:
                     self.__error("Expected '=' or ','")
 
-        if self.symbol.type == self.scanner.SEMICOLON:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == SEMICOLON:
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected ';'", None)
 
-    def __devicename(self):
-        """Parse device name.
+    def __device_ids(self):
+        """Return the name IDs of the device names in the current list.
 
-        Returns:
-            Bool: Device name conforms to syntax.
+        The scanner has already looked each name up in the shared names
+        table, so the IDs are read from the name symbols.
         """
-        return self.__name("devicename")
-
-    def __name(self, type):
-        """Parse name.
+        return [dev.id for dev in self.cur_device_name_list]
 
-        Args:
-            type (string): Specifies if name is for a device or for a pin
+    def __devicename(self):
+        """Parse device name.
 
         Returns:
-            Bool: Name conforms to syntax.
+            Bool: Device name conforms to syntax.
         """
-        if self.symbol.type == self.scanner.NAME:
-            if type == "devicename":
-                if not self.error_:
-                    self.cur_device_name_list.append(self.symbol)
-            if type == "pinname":
-                if not self.error_:
-                    self.cur_pin_name_list.append(self.symbol)
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == NAME:
+            if not self.error_:
+                self.cur_device_name_list.append(self.symbol)
+            self.symbol = self.get_symbol()
             return True
-        elif self.symbol.type == self.scanner.KEYWORD:
+        elif self.symbol.type == KEYWORD:
+            self.__error(NAME_KEYWORD_ERROR)
+        else:
             self.__error(
-                "Names cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
-                " 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR',"
-                " 'NOR', 'XOR', 'NOT', 'DTYPE'"
+                "Device names must start with a letter and be alphanumeric"
             )
-        else:
-            if type == "devicename":
-                self.__error(
-                    "Device names must start with a letter and be alphanumeric"
-                )
-            elif type == "pinname":
-                self.__error(
-                    "Pin names must start with a letter and be alphanumeric"
-                )
             return False
 
     def __clock(self):
         """Parse clock definition."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NUMBER:
+        if self.symbol.type == PARENTHESIS_LEFT:
+            self.symbol = self.get_symbol()
+            if self.symbol.type == NUMBER:
                 num = int(self.symbol.string)
                 if num <= 0:
                     self.__error("Clock half period must be greater than 0")
@@ -379,9 +353,9 @@ class Parser:
                 if not self.error_:
                     self.cur_attribute = num
                 if not self.skip:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                        self.symbol = self.scanner.get_symbol()
+                    self.symbol = self.get_symbol()
+                    if self.symbol.type == PARENTHESIS_RIGHT:
+                        self.symbol = self.get_symbol()
                     else:
                         self.__error("Expected ')'")
                 self.skip = False
@@ -395,14 +369,15 @@ class Parser:
 
     def __switch(self):
         """Parse switch definition."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.id == 0 or self.symbol.id == 1:
+        if self.symbol.type == PARENTHESIS_LEFT:
+            self.symbol = self.get_symbol()
+            switch_state = self.symbol.id
+            if switch_state == 0 or switch_state == 1:
                 if not self.error_:
-                    self.cur_attribute = self.symbol.id
-                self.symbol = self.scanner.get_symbol()
-                if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                    self.symbol = self.scanner.get_symbol()
+                    self.cur_attribute = switch_state
+                self.symbol = self.get_symbol()
+                if self.symbol.type == PARENTHESIS_RIGHT:
+                    self.symbol = self.get_symbol()
                 else:
                     self.__error("Expected ')'")
             else:
@@ -410,89 +385,15 @@ class Parser:
         else:
             self.__error("Expected '('")
 
-    def __And(self):
-        """Parse AND gate defintion."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NUMBER:
-                num = int(self.symbol.string)
-                if not (0 < num and num <= 16):
-                    self.skip = True
-                    self.__error("Number of inputs must be between 1-16")
-                if not self.error_:
-                    self.cur_attribute = num
-                if not self.skip:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                        self.symbol = self.scanner.get_symbol()
-                    else:
-                        self.__error("Expected ')'")
-                self.skip = False
-            else:
-                self.__error(
-                    "Expected number of inputs for AND gate (valid range:"
-                    " 1-16)"
-                )
-        else:
-            self.__error("Expected '('")
-
-    def __nand(self):
-        """Parse NAND gate definiton."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NUMBER:
-                num = int(self.symbol.string)
-                if not (0 < num and num <= 16):
-                    self.skip = True
-                    self.__error("Number of inputs must be between 1-16")
-                if not self.error_:
-                    self.cur_attribute = num
-                if not self.skip:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                        self.symbol = self.scanner.get_symbol()
-                    else:
-                        self.__error("Expected ')'")
-                self.skip = False
-            else:
-                self.__error(
-                    "Expected number of inputs for NAND gate (valid range:"
-                    " 1-16)"
-                )
-        else:
-            self.__error("Expected '('")
-
-    def __nor(self):
-        """Parse NOR gate definition."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NUMBER:
-                num = int(self.symbol.string)
-                if not (0 < num and num <= 16):
-                    self.skip = True
-                    self.__error("Number of inputs must be between 1-16")
-                if not self.error_:
-                    self.cur_attribute = num
-                if not self.skip:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                        self.symbol = self.scanner.get_symbol()
-                    else:
-                        self.__error("Expected ')'")
-                self.skip = False
-            else:
-                self.__error(
-                    "Expected number of inputs for NOR gate (valid range:"
-                    " 1-16)"
-                )
-        else:
-            self.__error("Expected '('")
+    def __gate_inputs(self, gate_name):
+        """Parse the number of inputs of an AND, NAND, OR or NOR gate.
 
-    def __oor(self):
-        """Parse OR gate definition."""
-        if self.symbol.type == self.scanner.PARENTHESIS_LEFT:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NUMBER:
+        Args:
+            gate_name (string): Gate type named in the error messages
+        """
+        if self.symbol.type == PARENTHESIS_LEFT:
+            self.symbol = self.get_symbol()
+            if self.symbol.type == NUMBER:
                 num = int(self.symbol.string)
                 if not (0 < num and num <= 16):
                     self.skip = True
@@ -500,15 +401,16 @@ class Parser:
                 if not self.error_:
                     self.cur_attribute = num
                 if not self.skip:
-                    self.symbol = self.scanner.get_symbol()
-                    if self.symbol.type == self.scanner.PARENTHESIS_RIGHT:
-                        self.symbol = self.scanner.get_symbol()
+                    self.symbol = self.get_symbol()
+                    if self.symbol.type == PARENTHESIS_RIGHT:
+                        self.symbol = self.get_symbol()
                     else:
                         self.__error("Expected ')'")
                 self.skip = False
             else:
                 self.__error(
-                    "Expected number of inputs for OR gate (valid range: 1-16)"
+                    f"Expected number of inputs for {gate_name} gate (valid"
+                    " range: 1-16)"
                 )
         else:
             self.__error("Expected '('")
@@ -519,31 +421,28 @@ class Parser:
         right_brace = True
         if not self.skip:
             if (
-                self.symbol.type == self.scanner.KEYWORD
-                and self.symbol.id == self.scanner.CONNECT_ID
+                self.symbol.type == KEYWORD
+                and self.symbol.id == self.CONNECT_ID
             ):
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
             else:
                 self.__error("Expected 'CONNECT'", "{")
         self.skip = False
 
-        if self.symbol.type == self.scanner.BRACE_LEFT:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == BRACE_LEFT:
+            self.symbol = self.get_symbol()
 
         else:
             self.__error("Expected '{'", None)
 
         self.__con()
 
-        while (
-            self.symbol.type != self.scanner.BRACE_RIGHT
-            and self.symbol.type != self.scanner.EOF
-        ):
+        while self.symbol.type not in LIST_END_TYPES:
             # Check for MONITOR to detect missing right brace
-            if self.symbol.id == self.scanner.MONITOR_ID:
-                self.check_symbol = self.scanner.get_symbol()
+            if self.symbol.id == self.MONITOR_ID:
+                self.check_symbol = self.get_symbol()
                 # Checks for right brace to detect missing semi-colon
-                if self.check_symbol.type == self.scanner.BRACE_LEFT:
+                if self.check_symbol.type == BRACE_LEFT:
                     self.skip = True
                     self.__error("Expected '}'", None)
                     self.symbol = self.check_symbol
@@ -551,12 +450,8 @@ class Parser:
                     break
                 # Or use of MONITOR as device name
                 else:
-                    self.__error(
-                        "Device names cannot be Keywords: 'CIRCUIT',"
-                        " 'DEVICES', 'CONNECT', 'MONITOR', 'END','CLOCK',"
-                        " 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR', 'NOT' 'DTYPE'"
-                    )
-                    self.symbol = self.scanner.get_symbol()
+                    self.__error(DEVICE_NAME_KEYWORD_ERROR)
+                    self.symbol = self.get_symbol()
 
             self.__con()
 
@@ -568,34 +463,31 @@ class Parser:
                 )
 
         if right_brace:
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
 
     def __con(self):
         """Parse connection."""
-        self.cur_device_name_list = []
-        self.cur_pin_name_list = []
+        self.cur_device_name_list.clear()
+        self.cur_pin_name_list.clear()
         if self.__point():
             if not self.error_:
                 out_device_sym = self.cur_device_name_list[0]
                 out_pin_sym = self.cur_pin_name_list[0]
-                out_device_id = self.__names.query(out_device_sym.string)
-                out_pin_id = self.__names.query(out_pin_sym.string)
-                self.cur_device_name_list = []
-                self.cur_pin_name_list = []
-            if self.symbol.type == self.scanner.ARROW:
+                out_device_id = out_device_sym.id
+                out_pin_id = out_pin_sym.id
+                self.cur_device_name_list.clear()
+                self.cur_pin_name_list.clear()
+            if self.symbol.type == ARROW:
                 self.cur_arrow = self.symbol
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
                 self.__point()
-                while (
-                    self.symbol.type == self.scanner.COMMA
-                    and self.symbol.type != self.scanner.EOF
-                ):
-                    self.symbol = self.scanner.get_symbol()
+                while self.symbol.type == COMMA:
+                    self.symbol = self.get_symbol()
                     self.__point()
 
-                if self.symbol.type != self.scanner.SEMICOLON:
+                if self.symbol.type != SEMICOLON:
                     # Checks for right brace to detect missing semi-colon
-                    if self.symbol.type == self.scanner.BRACE_RIGHT:
+                    if self.symbol.type == BRACE_RIGHT:
                         self.skip = True
                         self.__error("Expected ';'", None)
                     else:
@@ -604,19 +496,12 @@ class Parser:
                 self.__error("Expected '>'")
 
         if not self.error_:
-            cur_in_device_ids = [
-                self.__names.query(dev.string)
-                for dev in self.cur_device_name_list
-            ]
-            cur_in_pin_ids = [
-                self.__names.query(dev.string) for dev in self.cur_pin_name_list
-            ]
-
-            for i in range(len(cur_in_device_ids)):
-                in_dev_id = cur_in_device_ids[i]
-                in_pin_id = cur_in_pin_ids[i]
+            # name symbols carry the IDs the scanner looked up
+            for in_dev_sym, in_pin_sym in zip(
+                self.cur_device_name_list, self.cur_pin_name_list
+            ):
                 error = self.network.make_connection(
-                    out_device_id, out_pin_id, in_dev_id, in_pin_id
+                    out_device_id, out_pin_id, in_dev_sym.id, in_pin_sym.id
                 )
                 if error != self.network.NO_ERROR:
                     if (
@@ -626,13 +511,13 @@ class Parser:
                         self.__error(
                             self.network.error_message[error],
                             None,
-                            self.cur_pin_name_list[i],
+                            in_pin_sym,
                         )
                     elif error == self.network.DEVICE_ABSENT_2:
                         self.__error(
                             self.network.error_message[error],
                             None,
-                            self.cur_device_name_list[i],
+                            in_dev_sym,
                         )
                     elif error == self.network.DEVICE_ABSENT_1:
                         self.__error(
@@ -654,8 +539,8 @@ class Parser:
                         )
                     break
         if not self.skip:
-            if self.symbol.type == self.scanner.SEMICOLON:
-                self.symbol = self.scanner.get_symbol()
+            if self.symbol.type == SEMICOLON:
+                self.symbol = self.get_symbol()
             else:
                 self.__error("Expected ';'", None)
         self.skip = False
@@ -667,13 +552,11 @@ class Parser:
             Bool: Point conforms to syntax.
         """
         if self.__devicename():
-            if self.symbol.type == self.scanner.DOT:
-                self.symbol = self.scanner.get_symbol()
+            if self.symbol.type == DOT:
+                self.symbol = self.get_symbol()
                 return self.__pinname()
             else:
-                symb = Symbol()
-                symb.string = None
-                self.cur_pin_name_list.append(symb)
+                self.cur_pin_name_list.append(NO_PIN_SYMBOL)
             return True
         else:
             return False
@@ -684,59 +567,70 @@ class Parser:
         Returns:
             Bool: Name conforms to syntax.
         """
-        return self.__name("pinname")
+        if self.symbol.type == NAME:
+            if not self.error_:
+                self.cur_pin_name_list.append(self.symbol)
+            self.symbol = self.get_symbol()
+            return True
+        elif self.symbol.type == KEYWORD:
+            self.__error(NAME_KEYWORD_ERROR)
+        else:
+            self.__error(
+                "Pin names must start with a letter and be alphanumeric"
+            )
+            return False
 
     def __monitorlist(self):
         """Parse monitor list."""
         right_brace = True
         if not self.skip:
             if (
-                self.symbol.type == self.scanner.KEYWORD
-                and self.symbol.id == self.scanner.MONITOR_ID
+                self.symbol.type == KEYWORD
+                and self.symbol.id == self.MONITOR_ID
             ):
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
             else:
                 self.__error("Expected 'MONITOR'", "{")
         self.skip = False
 
-        if self.symbol.type == self.scanner.BRACE_LEFT:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == BRACE_LEFT:
+            self.symbol = self.get_symbol()
             self.__monitor()
 
-            while (
-                self.symbol.type != self.scanner.BRACE_RIGHT
-                and self.symbol.type != self.scanner.EOF
-            ):
+            while self.symbol.type not in LIST_END_TYPES:
                 # Checks for END to detect missing right braces
-                if self.symbol.id == self.scanner.END_ID:
+                if self.symbol.id == self.END_ID:
                     self.__error("Expected '}'", None)
                     right_brace = False
                     break
                 self.__monitor()
             if right_brace:
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
         else:
             self.__error("Expected '{'", None)
 
     def __monitor(self):
         """Parse monitor definition."""
-        self.cur_device_name_list = []
-        self.cur_pin_name_list = []
+        self.cur_device_name_list.clear()
+        self.cur_pin_name_list.clear()
         self.__point()
         if not self.error_:
             error = self.__monitors.make_monitor(
-                self.__names.query(self.cur_device_name_list[0].string),
-                self.__names.query(self.cur_pin_name_list[0].string),
+                self.cur_device_name_list[0].id,
+                self.cur_pin_name_list[0].id,
             )
             if error != self.__monitors.NO_ERROR:
                 self.__error(self.__monitors.error_message[error], None)
-        if self.symbol.type == self.scanner.SEMICOLON:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == SEMICOLON:
+            self.symbol = self.get_symbol()
         else:
             self.__error("Expected ';'", None)
 
     def __error(self, message, stopping_symbol=";", symbol=None):
-        """Generate error message, update error counter, set error state.
+        """Record error message, update error counter, set error state.
+
+        The message is formatted and printed by print_pending_errors, when
+        parsing finishes or before the scanner prints an error.
 
         Args:
             message (str): error message for printing
@@ -744,22 +638,23 @@ class Parser:
             Defaults to ";".
             symbol (symbol object): error symbol object passed to scanner
             for error message construction. Defaults to None.
-
-        Returns:
-            str: error message.
         """
         if symbol is None:
             symbol = self.symbol
         self.error_ = True
         self.error_count += 1
-        error_output = self.scanner.print_error(symbol, message)
+        self.pending_errors.append((symbol, message))
         if stopping_symbol is not None:
-            while (
-                self.symbol.string != stopping_symbol
-                and self.symbol.type != self.scanner.EOF
+            stopping_type = self.stopping_symbol_types[stopping_symbol]
+            if (
+                self.symbol.type != stopping_type
+                and self.symbol.type != EOF
             ):
-                self.symbol = self.scanner.get_symbol()
-
-        self.error_msg += "\n\n" + error_output
-
-        return error_output
+                # skipped symbols are discarded, so reuse one Symbol object
+                symbol = Symbol()
+                get_symbol_into = self.scanner.get_symbol_into
+                end_types = (stopping_type, EOF)
+                get_symbol_into(symbol)
+                while symbol.type not in end_types:
+                    get_symbol_into(symbol)
+                self.symbol = symbol
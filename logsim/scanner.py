@@ -8,10 +8,161 @@ Classes
 Scanner - reads definition file and translates characters into symbols.
 Symbol - encapsulates a symbol and stores its properties.
 """
+import array
+import bisect
 import sys
 from pathlib import Path
 
-import numpy as np
+import numpy
+
+from scanner_constants import (
+    ARROW,
+    BACKSLASH,
+    BRACE_LEFT,
+    BRACE_RIGHT,
+    CHARACTER_CLASSES,
+    COMMA,
+    COMMENT,
+    DOT,
+    EOF,
+    EQUALS,
+    INVALID_CHARACTER,
+    KEYWORD,
+    NAME,
+    NUMBER,
+    OPEN_COMMENT,
+    PARENTHESIS_LEFT,
+    PARENTHESIS_RIGHT,
+    SEMICOLON,
+    WHITESPACE,
+    ZERO,
+    classify,
+)
+
+# reserved words, in the order their name IDs are allocated
+KEYWORDS = (
+    "CIRCUIT",
+    "DEVICES",
+    "CONNECT",
+    "MONITOR",
+    "END",
+    "CLOCK",
+    "SWITCH",
+    "AND",
+    "NAND",
+    "OR",
+    "NOR",
+    "XOR",
+    "NOT",
+    "DTYPE",
+)
+
+
+def scan_symbol(buffer, position):
+    """Find the next symbol in buffer, starting from position.
+
+    Whitespace and comments are skipped. Return the symbol type and the
+    positions of the first character of the symbol and the character after
+    it. Names are returned as NAME, the caller separates out the keywords.
+    """
+    length = len(buffer)
+    character_class = EOF
+    while position < length:
+        character = buffer[position]
+        if character < 256:
+            character_class = CHARACTER_CLASSES[character]
+        else:
+            character_class = classify(character)
+        if character_class == WHITESPACE:
+            position += 1
+        elif (
+            character_class == COMMENT
+            and position + 1 < length
+            and buffer[position + 1] == BACKSLASH
+        ):
+            # skip the two backslashes that open the comment, then find the
+            # two that close it
+            position += 2
+            if type(buffer) is bytes:  # ASCII files, searched in one call
+                position = buffer.find(b"\\\\", position)
+                if position == -1:
+                    return OPEN_COMMENT, length, length
+            else:
+                while position + 1 < length and not (
+                    buffer[position] == BACKSLASH
+                    and buffer[position + 1] == BACKSLASH
+                ):
+                    position += 1
+                if position + 1 >= length:
+                    return OPEN_COMMENT, length, length
+            position += 2
+        else:
+            break
+
+    if position >= length:
+        return EOF, length, length
+
+    start = position
+    position += 1
+    if character_class == NAME:
+        # letters and digits that follow are part of the name
+        while position < length:
+            character = buffer[position]
+            if character < 128:
+                following_class = CHARACTER_CLASSES[character]
+                if not (
+                    following_class == NAME
+                    or following_class == NUMBER
+                    or following_class == ZERO
+                ):
+                    break
+            elif not chr(character).isalnum():
+                break
+            position += 1
+    elif character_class == NUMBER:
+        # a zero on its own is ZERO, it never starts a longer number
+        while position < length:
+            character = buffer[position]
+            if character < 128:
+                if not 48 <= character <= 57:
+                    break
+            elif not chr(character).isdigit():
+                break
+            position += 1
+    elif character_class == COMMENT:  # a single backslash
+        character_class = INVALID_CHARACTER
+    return character_class, start, position
+
+
+# the interpreted scan, which the Cython build has to match
+python_scan_symbol = scan_symbol
+
+try:  # Cython build of the same scan, see scanner_core.pyx
+    from scanner_core import scan_symbol
+except ImportError:
+    pass
+
+
+def scan_all(buffer):
+    """Scan every symbol in buffer, up to and including the end of file.
+
+    Return arrays of the symbol types, and of the start and end positions of
+    their characters, as given by scan_symbol for each symbol in turn.
+    """
+    # every character can be a symbol, plus the end of file
+    types = numpy.empty(len(buffer) + 1, dtype=numpy.int8)
+    starts = numpy.empty(len(buffer) + 1, dtype=numpy.int32)
+    ends = numpy.empty(len(buffer) + 1, dtype=numpy.int32)
+    count = 0
+    position = 0
+    while True:
+        symbol_type, start, position = scan_symbol(buffer, position)
+        types[count] = symbol_type
+        starts[count] = start
+        ends[count] = position
+        count += 1
+        if symbol_type == EOF or symbol_type == OPEN_COMMENT:
+            return types[:count], starts[:count], ends[:count]
 
 
 class Symbol:
@@ -26,6 +177,8 @@ class Symbol:
     No public methods.
     """
 
+    __slots__ = ("type", "id", "position", "string")
+
     def __init__(self):
         """Initialise symbol properties."""
         self.type = None
@@ -51,13 +204,11 @@ class Scanner:
     -------------
     get_symbol(self): Translates the next sequence of characters into a symbol
                       and returns the symbol
-    skip_spaces(self): Skips whitespace to next character
-    advance(self): Advances one more character in the file
-    backwards(self): Goes back one character in the file
-    get_name(self): Gets full name symbol
-    get_number(self): Gets full number symbol
-    check_comment(self): Checks to see if a second backslash follows the
-                         first to signal the start or end of a comment
+    get_symbol_into(self, symbol): Translates the next sequence of characters
+                                   into the given symbol
+    tokenize_all(self): Returns arrays of the types and positions of all the
+                        symbols in the file
+    iter_symbols(self): Yields symbols up to and including the end of file
     print_error(self, symbol, suggestion): Prints error line with marker
                                            and suggestion of error cause
     """
@@ -68,9 +219,25 @@ class Scanner:
         if Path(str(path)).is_file():
             # check file is a text file
             if Path(str(path)).suffix == ".txt":
-                self.file = open(Path(str(path)), "r")
-                self.line_lengths = [len(line) for line in self.file]
-                self.file.seek(0, 0)
+                source = Path(str(path)).read_bytes()
+                # read line breaks the way a text mode file would
+                if b"\r" in source:
+                    source = source.replace(b"\r\n", b"\n")
+                    source = source.replace(b"\r", b"\n")
+                # character codes for scan_symbol, the bytes themselves if
+                # every character is one byte
+                if source.isascii():
+                    self.text = source.decode("ascii")
+                    self.buffer = source
+                else:
+                    self.text = source.decode()
+                    self.buffer = array.array("L", map(ord, self.text))
+                # file positions of the first character of each line, which
+                # is the start of the file or follows a line break
+                line_breaks = numpy.asarray(memoryview(self.buffer)) == 10
+                self.line_starts = numpy.flatnonzero(
+                    numpy.concatenate(([True], line_breaks[:-1]))
+                ).tolist()
                 self.file_position = 0
                 self.names = names
                 self.symbol_type_list = [
@@ -90,22 +257,7 @@ class Scanner:
                     self.EOF,
                     self.INVALID_CHARACTER,
                 ] = range(15)
-                self.keywords_list = [
-                    "CIRCUIT",
-                    "DEVICES",
-                    "CONNECT",
-                    "MONITOR",
-                    "END",
-                    "CLOCK",
-                    "SWITCH",
-                    "AND",
-                    "NAND",
-                    "OR",
-                    "NOR",
-                    "XOR",
-                    "NOT",
-                    "DTYPE",
-                ]
+                self.keywords_list = list(KEYWORDS)
                 [
                     self.CIRCUIT_ID,
                     self.DEVICES_ID,
@@ -121,10 +273,18 @@ class Scanner:
                     self.XOR_ID,
                     self.NOT_ID,
                     self.DTYPE_ID,
-                ] = self.names.lookup(self.keywords_list)
-                self.current_character = self.file.read(1)
-                self.comment = False
+                ] = keyword_id_list = self.names.lookup(self.keywords_list)
+                # name ID of each keyword, found with one hashed lookup
+                self.keyword_ids = dict(
+                    zip(self.keywords_list, keyword_id_list)
+                )
+                # name ID of each user name seen so far, as names.lookup
+                # gave it
+                self.name_ids = {}
                 self.max_error_line_length = 79
+                # called before the scanner prints an error of its own, so
+                # a parser can print the errors it found earlier first
+                self.before_error = None
             else:
                 print(
                     "\n\nError: Invalid file type. Please choose a text"
@@ -141,156 +301,62 @@ class Scanner:
     def get_symbol(self):
         """Translate the next sequence of characters into a symbol."""
         symbol = Symbol()
-        self.skip_spaces()  # current character now not whitespace
-
-        if self.current_character == "\\":
-            self.comment = self.check_comment()  # check if start of comment
-            # if only one backslash -> invalid character selection
-            if not self.comment:
-                self.backwards()
-            while self.comment:
-                # if end of file is found while in comment
-                if self.current_character == "":
-                    break
-                # check if comment is finished
-                elif self.current_character == "\\":
-                    self.comment = self.check_comment()
-                self.advance()
-            else:
-                self.skip_spaces()  # skip whitespace after comment
+        self.get_symbol_into(symbol)
+        return symbol
 
-        symbol.position = self.file_position
+    def get_symbol_into(self, symbol):
+        """Translate the next sequence of characters into the given symbol.
 
-        if self.current_character.isalpha():  # letter
-            name_string = self.get_name()
-            if name_string in self.keywords_list:
-                symbol.type = self.KEYWORD
-            else:
-                symbol.type = self.NAME
-            [symbol.id] = self.names.lookup([name_string])
-            symbol.string = name_string
-
-        elif self.current_character.isdigit():  # number
-            if int(self.current_character) == 0:
-                symbol.id = 0
-                symbol.type = self.ZERO
-                self.advance()
+        Callers that discard each symbol can reuse one Symbol object.
+        """
+        symbol.id = None
+        symbol.type, symbol.position, self.file_position = scan_symbol(
+            self.buffer, self.file_position
+        )
+        symbol.string = self.text[symbol.position : self.file_position]
+
+        if symbol.type == self.NAME:
+            # interned names compare by identity in the keyword IDs, the
+            # names table and the parser
+            symbol.string = sys.intern(symbol.string)
+            symbol.id = self.keyword_ids.get(symbol.string)
+            if symbol.id is None:
+                symbol.id = self.name_ids.get(symbol.string)
+                if symbol.id is None:
+                    [symbol.id] = self.names.lookup([symbol.string])
+                    self.name_ids[symbol.string] = symbol.id
             else:
-                symbol.id = self.get_number()
-                symbol.type = self.NUMBER
-            symbol.string = str(symbol.id)
-
-        elif self.current_character == ",":
-            symbol.type = self.COMMA
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == ";":
-            symbol.type = self.SEMICOLON
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == "=":
-            symbol.type = self.EQUALS
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == "{":
-            symbol.type = self.BRACE_LEFT
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == "}":
-            symbol.type = self.BRACE_RIGHT
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == "(":
-            symbol.type = self.PARENTHESIS_LEFT
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == ")":
-            symbol.type = self.PARENTHESIS_RIGHT
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == ">":
-            symbol.type = self.ARROW
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == ".":
-            symbol.type = self.DOT
-            symbol.string = self.current_character
-            self.advance()
-
-        elif self.current_character == "":  # end of file
+                symbol.type = self.KEYWORD
+        elif symbol.type == self.NUMBER:
+            symbol.id = int(symbol.string)
+        elif symbol.type == self.ZERO:
+            symbol.id = 0
+        elif symbol.type == OPEN_COMMENT:  # file ends with open comment
             symbol.type = self.EOF
-            symbol.string = self.current_character
-            self.advance()
-
-        else:  # not a valid character
-            symbol.type = self.INVALID_CHARACTER
-            symbol.string = self.current_character
-            self.advance()
-
-        # if file ends with open comment
-        if symbol.type == self.EOF and self.comment:
+            if self.before_error is not None:
+                self.before_error()
             self.print_error(
                 symbol, "File ended with open comment. Expected '\\\\'"
             )
 
-        return symbol
+    def tokenize_all(self):
+        """Return the types, start and end positions of all the symbols.
 
-    def skip_spaces(self):
-        """Skip whitespace to next character."""
-        while self.current_character.isspace():
-            self.advance()
-
-    def advance(self):
-        """Advance one more character."""
-        self.current_character = self.file.read(1)
-        self.file_position += 1
-
-    def backwards(self):
-        """Go back one character."""
-        if self.current_character == "":
-            self.file.seek(self.file.tell() - 1, 0)
-            self.file_position -= 1
-        else:
-            self.file.seek(self.file.tell() - 2, 0)
-            self.file_position -= 2
-        self.advance()
-
-    def get_name(self):
-        """Get full name symbol."""
-        name = self.current_character
-        self.advance()
-        # get all following alphanumeric characters and add to name
-        while self.current_character.isalnum():
-            name += self.current_character
-            self.advance()
-
-        return name
-
-    def get_number(self):
-        """Get full number symbol."""
-        number = int(self.current_character)
-        self.advance()
-        # get all following digits and add to number
-        while self.current_character.isdigit():
-            number = number * 10 + int(self.current_character)
-            self.advance()
-
-        return number
-
-    def check_comment(self):
-        """Check to see if this is start or end of a comment."""
-        self.advance()
-        if self.current_character == "\\":  # if second backslash follows first
-            return not self.comment
-        return self.comment
+        The file is scanned in one pass from the beginning, independent of
+        get_symbol. Keywords have type NAME, and a file ending inside a
+        comment ends with OPEN_COMMENT instead of EOF.
+        """
+        return scan_all(self.buffer)
+
+    def iter_symbols(self):
+        """Yield symbols up to and including the end of file symbol."""
+        get_symbol = self.get_symbol
+        eof = self.EOF
+        while True:
+            symbol = get_symbol()
+            yield symbol
+            if symbol.type == eof:
+                return
 
     def print_error(self, symbol, suggestion=""):
         """Print error line with marker.
@@ -299,29 +365,19 @@ class Scanner:
             symbol -- Symbol that caused the error
             suggestion -- String that suggests correct character
         """
-        current_position = self.file.tell()
-
-        # find start of line positions by summing line lengths
-        sol_pos = np.array(
-            [sum(self.line_lengths[:i]) for i in range(len(self.line_lengths))]
-        )
-        # positions of first character of lines relative to marker
-        sol_pos_rel_marker = sol_pos - symbol.position
-        if len(sol_pos_rel_marker) == 0:
-            line_text = ""
-            position = 0
-            line = 1
-        else:
-            # position on line (starts at 0)
-            position = -max([i for i in sol_pos_rel_marker if i <= 0])
-            # line of file (starts at 1)
-            line = np.where(sol_pos_rel_marker == -position)[0][0] + 1
-
-            # set current position to start of file
-            self.file.seek(0, 0)
-
-            # split file by line breaks to get error line text
-            line_text = self.file.read().split("\n")[line - 1]
+        # index of the last line starting at or before the marker
+        line_index = bisect.bisect_right(self.line_starts, symbol.position) - 1
+        line_start = self.line_starts[line_index]
+        # position on line (starts at 0)
+        position = symbol.position - line_start
+        # line of file (starts at 1)
+        line = line_index + 1
+
+        # slice the error line out of the text, up to its line break
+        line_end = self.text.find("\n", line_start)
+        if line_end == -1:  # last line of the file
+            line_end = len(self.text)
+        line_text = self.text[line_start:line_end]
 
         # shorten output if line is very long
         if len(line_text) > self.max_error_line_length:
@@ -360,6 +416,4 @@ class Scanner:
         )
         print("\n\n" + output)
 
-        self.file.seek(current_position, 0)
-
         return output
@@ -0,0 +1,69 @@
+"""Symbol types and character classes shared by the scanners.
+
+Used in the Logic Simulator project. Both scanner.py and the Cython build in
+scanner_core.pyx import these, so neither has to import the other.
+"""
+import unicodedata
+
+# symbol types, in the order of Scanner.symbol_type_list
+[
+    COMMA,
+    SEMICOLON,
+    EQUALS,
+    KEYWORD,
+    NUMBER,
+    ZERO,
+    NAME,
+    BRACE_LEFT,
+    BRACE_RIGHT,
+    PARENTHESIS_LEFT,
+    PARENTHESIS_RIGHT,
+    ARROW,
+    DOT,
+    EOF,
+    INVALID_CHARACTER,
+] = range(15)
+# returned by scan_symbol when the file ends inside a comment
+OPEN_COMMENT = 15
+# character classes that are not symbol types
+WHITESPACE = 16
+COMMENT = 17  # a backslash, which starts a comment if doubled
+
+BACKSLASH = ord("\\")
+
+PUNCTUATION = {
+    ",": COMMA,
+    ";": SEMICOLON,
+    "=": EQUALS,
+    "{": BRACE_LEFT,
+    "}": BRACE_RIGHT,
+    "(": PARENTHESIS_LEFT,
+    ")": PARENTHESIS_RIGHT,
+    ">": ARROW,
+    ".": DOT,
+    "\\": COMMENT,
+}
+
+
+def classify(code):
+    """Return the class scan_symbol gives the character with this code.
+
+    Letters start a NAME, digits a NUMBER (or ZERO) and punctuation is its
+    own symbol type. Letters, digits and whitespace outside ASCII are
+    recognised the way str.isalpha, str.isdigit and str.isspace see them.
+    """
+    character = chr(code)
+    if character.isspace():
+        return WHITESPACE
+    elif character.isalpha():
+        return NAME
+    elif character.isdigit():
+        # a zero digit in any script stands alone, like "0"
+        if unicodedata.digit(character) == 0:
+            return ZERO
+        return NUMBER
+    return PUNCTUATION.get(character, INVALID_CHARACTER)
+
+
+# class of each character code below 256, looked up by scan_symbol
+CHARACTER_CLASSES = bytes(classify(code) for code in range(256))
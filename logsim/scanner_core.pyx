@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled symbol scan for the scanner.
+
+Used in the Logic Simulator project. This is a Cython build of
+scanner.scan_symbol, following the same state machine and character
+classes, and must be kept in step with it. Build it in place with:
+
+    cythonize -i -3 scanner_core.pyx
+
+Functions
+---------
+scan_symbol - finds the next symbol in a buffer of character codes.
+"""
+import scanner_constants
+
+cdef unsigned char CHARACTER_CLASSES[256]
+for code in range(256):
+    CHARACTER_CLASSES[code] = scanner_constants.CHARACTER_CLASSES[code]
+
+cdef int NUMBER = scanner_constants.NUMBER
+cdef int ZERO = scanner_constants.ZERO
+cdef int NAME = scanner_constants.NAME
+cdef int EOF = scanner_constants.EOF
+cdef int INVALID_CHARACTER = scanner_constants.INVALID_CHARACTER
+cdef int OPEN_COMMENT = scanner_constants.OPEN_COMMENT
+cdef int WHITESPACE = scanner_constants.WHITESPACE
+cdef int COMMENT = scanner_constants.COMMENT
+cdef unsigned long BACKSLASH = scanner_constants.BACKSLASH
+
+# bytes for ASCII files, array("L") of code points otherwise
+ctypedef fused code_t:
+    unsigned char
+    unsigned long
+
+
+def scan_symbol(const code_t[::1] buffer, Py_ssize_t position):
+    """Find the next symbol in buffer, starting from position.
+
+    Whitespace and comments are skipped. Return the symbol type and the
+    positions of the first character of the symbol and the character after
+    it. Names are returned as NAME, the caller separates out the keywords.
+    """
+    cdef Py_ssize_t length = buffer.shape[0]
+    cdef Py_ssize_t start
+    cdef unsigned long character
+    cdef int character_class = EOF
+    cdef int following_class
+
+    while position < length:
+        character = buffer[position]
+        if character < 256:
+            character_class = CHARACTER_CLASSES[character]
+        else:
+            character_class = scanner_constants.classify(character)
+        if character_class == WHITESPACE:
+            position += 1
+        elif (
+            character_class == COMMENT
+            and position + 1 < length
+            and buffer[position + 1] == BACKSLASH
+        ):
+            # skip past the second backslash that closes the comment
+            position += 2
+            while position + 1 < length and not (
+                buffer[position] == BACKSLASH
+                and buffer[position + 1] == BACKSLASH
+            ):
+                position += 1
+            if position + 1 >= length:
+                return OPEN_COMMENT, length, length
+            position += 2
+        else:
+            break
+
+    if position >= length:
+        return EOF, length, length
+
+    start = position
+    position += 1
+    if character_class == NAME:
+        # letters and digits that follow are part of the name
+        while position < length:
+            character = buffer[position]
+            if character < 128:
+                following_class = CHARACTER_CLASSES[character]
+                if not (
+                    following_class == NAME
+                    or following_class == NUMBER
+                    or following_class == ZERO
+                ):
+                    break
+            elif not chr(character).isalnum():
+                break
+            position += 1
+    elif character_class == NUMBER:
+        # a zero on its own is ZERO, it never starts a longer number
+        while position < length:
+            character = buffer[position]
+            if character < 128:
+                if not 48 <= character <= 57:
+                    break
+            elif not chr(character).isdigit():
+                break
+            position += 1
+    elif character_class == COMMENT:  # a single backslash
+        character_class = INVALID_CHARACTER
+    return character_class, start, position
@@ -42,7 +42,15 @@ def test_lookup_raises_exceptions(used_names):
 
 
 @pytest.mark.parametrize(
-    "name_id, string", [(0, "Alice"), (1, "Bob"), (2, "Eve"), (3, None)]
+    "name_id, string",
+    [
+        (0, "Alice"),
+        (1, "Bob"),
+        (2, "Eve"),
+        (3, None),
+        (2.0, "Eve"),
+        ("1", "Bob"),
+    ],
 )
 def test_get_string(used_names, new_names, name_id, string):
     """Test if get_name_string returns the expected string."""
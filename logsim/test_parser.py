@@ -1,4 +1,6 @@
 """Test the parser module."""
+import ast
+
 import pytest
 from pathlib import Path
 
@@ -10,6 +12,13 @@ from devices import Devices
 from monitors import Monitors
 from translate import Translator
 
+# circuit definition files used by the tests, found from this file so the
+# tests can run from any directory
+TEST_FILES = Path(__file__).resolve().parent / "test_files"
+
+# the translator holds no parse state, so one serves every test
+TRANSLATOR = Translator()
+
 
 def new_parser(path):
     """Return a new parser instance"""
@@ -18,730 +27,494 @@ def new_parser(path):
     scanner = Scanner(path, names)
     network = Network(names, devices)
     monitors = Monitors(names, devices, network)
-    translator = Translator()
-    parser = Parser(names, devices, network, monitors, scanner, translator)
+    parser = Parser(names, devices, network, monitors, scanner, TRANSLATOR)
     return parser
 
 
+@pytest.fixture
+def parser(request):
+    """Return a new parser for the test file named by the parameter"""
+    return new_parser(str(TEST_FILES / request.param))
+
+
 def test_parser_returns_true():
     """Test parser returns true for valid circuit definition file"""
-    parser = new_parser(str(Path("test_files/test_parser1.1.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.1.txt"))
     assert parser.parse_network() == True
 
 
 @pytest.mark.parametrize(
-    "path",
+    "parser",
     [
-        "test_files/test_parser1.2.txt",
-        "test_files/test_parser1.3.txt",
-        "test_files/test_parser1.4.txt",
-        "test_files/test_parser1.5.txt",
-        "test_files/test_parser1.6.txt",
-        "test_files/test_parser1.7.txt",
-        "test_files/test_parser1.8.txt",
-        "test_files/test_parser1.9.txt",
-        "test_files/test_parser1.10.txt",
-        "test_files/test_parser1.11.txt",
-        "test_files/test_parser1.12.txt",
-        "test_files/test_parser1.13.txt",
-        "test_files/test_parser1.14.txt",
-        "test_files/test_parser1.15.txt",
-        "test_files/test_parser1.16.txt",
-        "test_files/test_parser1.17.txt",
-        "test_files/test_parser1.18.txt",
-        "test_files/test_parser1.19.txt",
-        "test_files/test_parser1.20.txt",
-        "test_files/test_parser1.21.txt",
-        "test_files/test_parser1.22.txt",
-        "test_files/test_parser1.23.txt",
-        "test_files/test_parser1.24.txt",
-        "test_files/test_parser1.25.txt",
-        "test_files/test_parser1.26.txt",
-        "test_files/test_parser1.27.txt",
+        path.name
+        for path in sorted(TEST_FILES.glob("test_parser1.*.txt"))
+        if path.name != "test_parser1.1.txt"
     ],
+    ids=lambda name: Path(name).stem,
+    indirect=True,
 )
-def test_parser_returns_false(path):
+def test_parser_returns_false(parser):
     """Test parser returns false for incorrect circuit definition files"""
-    parser = new_parser(str(Path(path)))
-    assert parser.parse_network() == False
-
-
-def test_parser_missing_equals(capfd):  # - instead of = in DEVICES
-    """Wrong symbol instead of equals sign in DEVICES"""
-    parser = new_parser(str(Path("test_files/test_parser1.2.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 6:\n\n"
-        + "    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
-        + "                            ^\n\n"
-        + "Expected '=' or ','\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_missing_dot(capfd):  # : instead of . in CONNECT
-    """Wrong symbol instead of dot in CONNECT"""
-    parser = new_parser(str(Path("test_files/test_parser1.3.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 19:\n\n"
-        + "    SW2 > xor1:I2, nor1.I1;\n"
-        + "              ^\n\n"
-        + "Expected '.' or ',' or ';'\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_missing_arrow(capfd):  # = instead of > in CONNECT
-    """Wrong symbol instead of > in CONNECT"""
-    parser = new_parser(str(Path("test_files/test_parser1.4.txt")))
     assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 33:\n\n"
-        + "    dt1.QBAR = nand4.I1;\n"
-        + "             ^\n\n"
-        + "Expected '>'\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_missing_MONITOR(capfd):  # MONITOR misspelled
-    """MONITOR misspelled"""
-    parser = new_parser(str(Path("test_files/test_parser1.5.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 36:\n\n"
-        + "MON1TOR\n"
-        + "^\n\n"
-        + "Expected 'MONITOR'\n"
-        + "Error Count: 1\n"
-    )
-
 
-def test_parser_missing_close_brace(capfd):  # missing brace end of CONNECT
-    """Missing right curly bracket at end of CONNECT"""
-    parser = new_parser(str(Path("test_files/test_parser1.6.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 36:\n\n"
-        + "MONITOR\n"
-        + "^\n\n"
-        + "Expected '}'\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_missing_open_brace(capfd):  # missing brace after CIRCUIT
-    """Missing left curly bracket after CIRCUIT"""
-    parser = new_parser(str(Path("test_files/test_parser1.7.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 4:\n\n"
-        + "DEVICES\n"
-        + "^\n\n"
-        + "Expected '{'\n"
-        + "Error Count: 1\n"
-    )
 
-
-def test_parser_missing_END(capfd):  # END misspelled
-    """END misspelled"""
-    parser = new_parser(str(Path("test_files/test_parser1.8.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 43:\n\n"
-        + "EN\n"
-        + "^\n\n"
-        + "Expected 'END'\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_bad_name(capfd):  # 4SW4 as a name definition
-    """Invalid name definition in DEVICES"""
-    parser = new_parser(str(Path("test_files/test_parser1.9.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 6:\n\n"
-        + "    SW1, SW2, SW3, 4SW4, SW5 = SWITCH(0);\n"
-        + "                   ^\n\n"
-        + "Device names must start with a letter and be alphanumeric\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_missing_semicolon(capfd):  # missing semicolon in MONITOR
-    """Missing a semicolon in MONITOR"""
-    parser = new_parser(str(Path("test_files/test_parser1.10.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 39:\n\n"
-        + "}\n"
-        + "^\n\n"
-        + "Expected ';'\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_bad_clock_param(capfd):  # clock parameter is zero
-    """Clock parameter is 0"""
-    parser = new_parser(str(Path("test_files/test_parser1.11.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 12:\n\n"
-        + "    CL1 = CLOCK(0);\n"
-        + "                ^\n\n"
-        + "Expected a number n > 0, the number of simulation cycles after"
+# files with errors, and the message the parser must print for each
+ERROR_CASES = [
+    pytest.param(  # wrong symbol instead of equals sign in DEVICES
+        "test_parser1.2.txt",
+        "\n\nError on line 6:\n\n"
+        "    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
+        "                            ^\n\n"
+        "Expected '=' or ','\n"
+        "Error Count: 1\n",
+        id="missing_equals",
+    ),
+    pytest.param(  # wrong symbol instead of dot in CONNECT
+        "test_parser1.3.txt",
+        "\n\nError on line 19:\n\n"
+        "    SW2 > xor1:I2, nor1.I1;\n"
+        "              ^\n\n"
+        "Expected '.' or ',' or ';'\n"
+        "Error Count: 1\n",
+        id="missing_dot",
+    ),
+    pytest.param(  # wrong symbol instead of > in CONNECT
+        "test_parser1.4.txt",
+        "\n\nError on line 33:\n\n"
+        "    dt1.QBAR = nand4.I1;\n"
+        "             ^\n\n"
+        "Expected '>'\n"
+        "Error Count: 1\n",
+        id="missing_arrow",
+    ),
+    pytest.param(  # MONITOR misspelled
+        "test_parser1.5.txt",
+        "\n\nError on line 36:\n\n"
+        "MON1TOR\n"
+        "^\n\n"
+        "Expected 'MONITOR'\n"
+        "Error Count: 1\n",
+        id="missing_MONITOR",
+    ),
+    pytest.param(  # missing right curly bracket at end of CONNECT
+        "test_parser1.6.txt",
+        "\n\nError on line 36:\n\n"
+        "MONITOR\n"
+        "^\n\n"
+        "Expected '}'\n"
+        "Error Count: 1\n",
+        id="missing_close_brace",
+    ),
+    pytest.param(  # missing left curly bracket after CIRCUIT
+        "test_parser1.7.txt",
+        "\n\nError on line 4:\n\n"
+        "DEVICES\n"
+        "^\n\n"
+        "Expected '{'\n"
+        "Error Count: 1\n",
+        id="missing_open_brace",
+    ),
+    pytest.param(  # END misspelled
+        "test_parser1.8.txt",
+        "\n\nError on line 43:\n\n"
+        "EN\n"
+        "^\n\n"
+        "Expected 'END'\n"
+        "Error Count: 1\n",
+        id="missing_END",
+    ),
+    pytest.param(  # invalid name definition in DEVICES
+        "test_parser1.9.txt",
+        "\n\nError on line 6:\n\n"
+        "    SW1, SW2, SW3, 4SW4, SW5 = SWITCH(0);\n"
+        "                   ^\n\n"
+        "Device names must start with a letter and be alphanumeric\n"
+        "Error Count: 1\n",
+        id="bad_name",
+    ),
+    pytest.param(  # missing a semicolon in MONITOR
+        "test_parser1.10.txt",
+        "\n\nError on line 39:\n\n"
+        "}\n"
+        "^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="missing_semicolon",
+    ),
+    pytest.param(  # clock parameter is 0
+        "test_parser1.11.txt",
+        "\n\nError on line 12:\n\n"
+        "    CL1 = CLOCK(0);\n"
+        "                ^\n\n"
+        "Expected a number n > 0, the number of simulation cycles after"
         " which the state changes\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_bad_switch_param(capfd):  # switch parameter is two
-    """Switch parameter is 2"""
-    parser = new_parser(str(Path("test_files/test_parser1.12.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 6:\n\n"
-        + "    SW1, SW2, SW3, SW4, SW5 = SWITCH(2);\n"
-        + "                                     ^\n\n"
-        + "Expected state, either 0(OFF) or 1(ON)\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_bad_gate_param_0(capfd):  # and gate parameter is 0
-    """AND gate parameter is 0"""
-    parser = new_parser(str(Path("test_files/test_parser1.13.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 11:\n\n"
-        + "    and1 = AND(0);\n"
-        + "               ^\n\n"
-        + "Expected number of inputs for AND gate (valid range: 1-16)\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_bad_device_definition(capfd):  # errors in switch definition
-    """Semicolon instead of comma in switch definition line"""
-    parser = new_parser(str(Path("test_files/test_parser1.14.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 6:\n\n"
-        + "    SW1; SWITCH2, SW3, SW4, SW5 = SWITCH(0);\n"
-        + "       ^\n\n"
-        + "Expected '=' or ','\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_xor_param(capfd):  # xor gate has a parameter
-    """XOR gate has a parameter"""
-    parser = new_parser(str(Path("test_files/test_parser1.15.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 9:\n\n" +
-#             "    xor1, xor2 = XOR(2);\n" +
-#             "                    ^\n\n" +
-#             "Expected ';'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_unsupported_device(capfd):  # declare unsupported device type
-    """Declare an unsupported device type"""
-    parser = new_parser(str(Path("test_files/test_parser1.16.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 14:\n\n"
-        + "    inv1, inv2, inv3 = XNOR;\n"
-        + "                       ^\n\n"
-        + "Not a supported device, supported devices: CLOCK, SWITCH, AND,"
+        "Error Count: 1\n",
+        id="bad_clock_param",
+    ),
+    pytest.param(  # switch parameter is 2
+        "test_parser1.12.txt",
+        "\n\nError on line 6:\n\n"
+        "    SW1, SW2, SW3, SW4, SW5 = SWITCH(2);\n"
+        "                                     ^\n\n"
+        "Expected state, either 0(OFF) or 1(ON)\n"
+        "Error Count: 1\n",
+        id="bad_switch_param",
+    ),
+    pytest.param(  # AND gate parameter is 0
+        "test_parser1.13.txt",
+        "\n\nError on line 11:\n\n"
+        "    and1 = AND(0);\n"
+        "               ^\n\n"
+        "Expected number of inputs for AND gate (valid range: 1-16)\n"
+        "Error Count: 1\n",
+        id="bad_gate_param_0",
+    ),
+    pytest.param(  # semicolon instead of comma in switch definition line
+        "test_parser1.14.txt",
+        "\n\nError on line 6:\n\n"
+        "    SW1; SWITCH2, SW3, SW4, SW5 = SWITCH(0);\n"
+        "       ^\n\n"
+        "Expected '=' or ','\n"
+        "Error Count: 1\n",
+        id="bad_device_definition",
+    ),
+    pytest.param(  # declare an unsupported device type
+        "test_parser1.16.txt",
+        "\n\nError on line 14:\n\n"
+        "    inv1, inv2, inv3 = XNOR;\n"
+        "                       ^\n\n"
+        "Not a supported device, supported devices: CLOCK, SWITCH, AND,"
         " NAND, OR, NOR, DTYPE, XOR, NOT\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_no_gate_param1(capfd):  # forgot to initialise a gate parameter
-    """No parentheses after a gate keyword"""
-    parser = new_parser(str(Path("test_files/test_parser1.17.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 7:\n\n"
-        + "    nand1, nand2, nand3, nand4 = NAND;\n"
-        + "                                     ^\n\n"
-        + "Expected '('\n"
-        + "Error Count: 1\n"
-    )
-
-
-def test_parser_no_gate_param2(capfd):  # forgot to initialise a gate parameter
-    """No number in parentheses after gate keyword"""
-    parser = new_parser(str(Path("test_files/test_parser1.18.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 8:\n\n"
-        + "    nor1, nor2 = NOR();\n"
-        + "                     ^\n\n"
-        + "Expected number of inputs for NOR gate (valid range: 1-16)\n"
-        + "Error Count: 1\n"
-    )
+        "Error Count: 1\n",
+        id="unsupported_device",
+    ),
+    pytest.param(  # no parentheses after a gate keyword
+        "test_parser1.17.txt",
+        "\n\nError on line 7:\n\n"
+        "    nand1, nand2, nand3, nand4 = NAND;\n"
+        "                                     ^\n\n"
+        "Expected '('\n"
+        "Error Count: 1\n",
+        id="no_gate_param1",
+    ),
+    pytest.param(  # no number in parentheses after gate keyword
+        "test_parser1.18.txt",
+        "\n\nError on line 8:\n\n"
+        "    nor1, nor2 = NOR();\n"
+        "                     ^\n\n"
+        "Expected number of inputs for NOR gate (valid range: 1-16)\n"
+        "Error Count: 1\n",
+        id="no_gate_param2",
+    ),
+    pytest.param(  # switch parameter is (01)
+        "test_parser1.19.txt",
+        "\n\nError on line 6:\n\n"
+        "    SW1, SW2, SW3, SW4, SW5 = SWITCH(01);\n"
+        "                                      ^\n\n"
+        "Expected ')'\n"
+        "Error Count: 1\n",
+        id="switch_param_is_01",
+    ),
+    pytest.param(  # pinname is not a valid name
+        "test_parser1.20.txt",
+        "\n\nError on line 26:\n\n"
+        "    nor2 > and1.1, xor2.I1;\n"
+        "                ^\n\n"
+        "Pin names must start with a letter and be alphanumeric\n"
+        "Error Count: 1\n",
+        id="bad_pinname",
+    ),
+    pytest.param(  # wrong symbol instead of comma in device definition
+        "test_parser1.22.txt",
+        "\n\nError on line 7:\n\n"
+        "    nand1, nand2, nand3/ nand4 = NAND(2);\n"
+        "                       ^\n\n"
+        "Expected '=' or ','\n"
+        "Error Count: 1\n",
+        id="bad_comma_in_device_def",
+    ),
+    pytest.param(  # semantic error input connected to input
+        "test_parser2.1.txt",
+        "\n\nError on line 22:\n\n    or1.I1 > nand1.I2;\n                 "
+        "  ^\n\nInput already connected\nError Count: 1\n",
+        id="input_to_input",
+    ),
+    pytest.param(  # semantic error output connected to output
+        "test_parser2.2.txt",
+        "\n\nError on line 21:\n\n    xor1 > nand1.I1, nor1;\n        "
+        " ^\n\nOutput connected to output\nError Count: 1\n",
+        id="output_to_output",
+    ),
+    pytest.param(  # semantic error input not connected
+        "test_parser2.3.txt",
+        "\n\nError on line 16:\n\nCONNECT\n^\n\nunconnected inputs:"
+        " nand3.I1 xor2.I1 \nError Count: 1\n",
+        id="input_not_connected",
+    ),
+    pytest.param(  # semantic error multiple connections to input
+        "test_parser2.4.txt",
+        "\n\nError on line 28:\n\n    and1 > dt1.DATA, nand2.I1;\n         "
+        "                  ^\n\nInput already connected\nError Count: 1\n",
+        id="multiple_connections_to_input",
+    ),
+    pytest.param(  # semantic error reference undeclared device
+        "test_parser2.5.txt",
+        "\n\nError on line 18:\n\n    SW1 > xor1.I1, or1.I1;\n         "
+        " ^\n\nSpecified device does not exist\nError Count: 1\n",
+        id="devicename_not_found",
+    ),
+    pytest.param(  # semantic error reference pinname I3 on a 2 input gate
+        "test_parser2.6.txt",
+        "\n\nError on line 27:\n\n    nand3 > and1.I3, nand4.I2;\n         "
+        "        ^\n\nSpecified port does not exist\nError Count: 1\n",
+        id="pinname_not_found",
+    ),
+    pytest.param(  # semantic error and gate has 17 inputs
+        "test_parser2.7.txt",
+        "\n\nError on line 11:\n\n    and1 = AND(17);\n              "
+        " ^\n\nNumber of inputs must be between 1-16\nError Count: 1\n",
+        id="too_many_inputs",
+    ),
+    pytest.param(  # semantic error devicename should not be keyword
+        "test_parser2.8.txt",
+        "\n\nError on line 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames"
+        " cannot"
+        " be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR',"
+        " 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR',"
+        " 'NOT', 'DTYPE'\nError Count: 1\n",
+        id="devicename_keyword",
+    ),
+    pytest.param(  # semantic error pinname should not be keyword
+        "test_parser2.9.txt",
+        "\n\nError on line 31:\n\n    SW5 > dt1.CONNECT;\n             "
+        " ^\n\nNames cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
+        " 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR',"
+        " 'XOR', 'NOT', 'DTYPE'\nError Count: 1\n",
+        id="pinname_keyword",
+    ),
+]
 
 
-def test_parser_switch_param_is_01(capfd):  # switch parameter is 01
-    """Switch parameter is (01)"""
-    parser = new_parser(str(Path("test_files/test_parser1.19.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 6:\n\n"
-        + "    SW1, SW2, SW3, SW4, SW5 = SWITCH(01);\n"
-        + "                                      ^\n\n"
-        + "Expected ')'\n"
-        + "Error Count: 1\n"
-    )
+@pytest.mark.parametrize(
+    "parser, expected", ERROR_CASES, indirect=["parser"]
+)
+def test_parser_error_message(parser, expected, capsys):
+    """Test parser prints the right error message for incorrect files"""
+    assert parser.parse_network() == False
+    out, _ = capsys.readouterr()
+    assert out == expected
+
+
+# files where the parser should stop at the first error, and the message
+# it should print. The parser also reports the errors that follow on from
+# the first one, so these do not pass yet.
+STOP_SYMBOL_CASES = [
+    pytest.param(  # XOR gate has a parameter
+        "test_parser1.15.txt",
+        "\n\nError on line 9:\n\n"
+        "    xor1, xor2 = XOR(2);\n"
+        "                    ^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="xor_param",
+    ),
+    pytest.param(  # comma instead of semicolon at the end of devices
+        "test_parser1.24.txt",
+        "\n\nError on line 13:\n\n"
+        "    dt1 = DTYPE,\n"
+        "               ^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol1",
+    ),
+    pytest.param(  # comma instead of semicolon at the end of connect
+        "test_parser1.25.txt",
+        "\n\nError on line 33:\n\n"
+        "    dt1.QBAR > nand4.I1,\n"
+        "                       ^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol2",
+    ),
+    pytest.param(  # comma instead of semicolon at the end of monitor
+        "test_parser1.28.txt",
+        "\n\nError on line 38:\n\n"
+        "    xor2; nand4,\n"
+        "               ^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol3",
+    ),
+    pytest.param(  # comma instead of semicolon in the middle of monitor
+        "test_parser1.31.txt",
+        "\n\nError on line 38:\n\n"
+        "    xor2, nand4;\n"
+        "        ^\n\n"
+        "Expected ';'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol6",
+    ),
+    pytest.param(  # wrong symbol instead of } at the end of devices
+        "test_parser1.32.txt",
+        "\n\nError on line 14:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '}'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol7",
+    ),
+    pytest.param(  # wrong symbol instead of } at the end of connect
+        "test_parser1.33.txt",
+        "\n\nError on line 34:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '}'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol8",
+    ),
+    pytest.param(  # wrong symbol instead of } at the end of monitor
+        "test_parser1.34.txt",
+        "\n\nError on line 39:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '}'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol9",
+    ),
+    pytest.param(  # wrong symbol instead of } at the end of circuit
+        "test_parser1.35.txt",
+        "\n\nError on line 41:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '}'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol10",
+    ),
+    pytest.param(  # wrong symbol instead of { at the start of circuit
+        "test_parser1.36.txt",
+        "\n\nError on line 2:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '{'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol11",
+    ),
+    pytest.param(  # wrong symbol instead of { at the start of devices
+        "test_parser1.37.txt",
+        "\n\nError on line 5:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '{'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol12",
+    ),
+    pytest.param(  # wrong symbol instead of { at the start of connect
+        "test_parser1.38.txt",
+        "\n\nError on line 17:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '{'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol13",
+    ),
+    pytest.param(  # wrong symbol instead of { at the start of monitor
+        "test_parser1.39.txt",
+        "\n\nError on line 37:\n\n"
+        "/\n"
+        "^\n\n"
+        "Expected '{'\n"
+        "Error Count: 1\n",
+        id="wrong_stop_symbol14",
+    ),
+]
+
+
+@pytest.mark.xfail(
+    reason="follow-on errors are reported as well", strict=True
+)
+@pytest.mark.parametrize(
+    "parser, expected", STOP_SYMBOL_CASES, indirect=["parser"]
+)
+def test_parser_stop_symbol_message(parser, expected, capsys):
+    """Test parser reports only the first error for a wrong stop symbol"""
+    parser.parse_network()
+    out, _ = capsys.readouterr()
+    assert out == expected
 
 
-def test_parser_bad_pinname(capfd):  # and1 pinname is 1 instead of I1
-    """Pinname is not a valid name"""
-    parser = new_parser(str(Path("test_files/test_parser1.20.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 26:\n\n"
-        + "    nor2 > and1.1, xor2.I1;\n"
-        + "                ^\n\n"
-        + "Pin names must start with a letter and be alphanumeric\n"
-        + "Error Count: 1\n"
-    )
+@pytest.mark.xfail(
+    reason="follow-on errors are counted as well", strict=True
+)
+@pytest.mark.parametrize(
+    "parser, count",
+    [
+        pytest.param(  # comma instead of semicolon at the end of all sections
+            "test_parser1.29.txt", 3, id="wrong_stop_symbol4"
+        ),
+        pytest.param(  # unknown symbols instead of the last semicolons
+            "test_parser1.30.txt", 3, id="wrong_stop_symbol5"
+        ),
+        pytest.param(  # wrong symbol instead of } at the end of all
+            "test_parser1.40.txt", 4, id="wrong_stop_symbol15"
+        ),
+        pytest.param(  # wrong symbol instead of { at the start of all
+            "test_parser1.41.txt", 4, id="wrong_stop_symbol16"
+        ),
+        pytest.param(  # / instead of { at start of circuit, no { for devices
+            "test_parser1.42.txt", 2, id="wrong_stop_symbol17"
+        ),
+        pytest.param(  # / instead of { at start of circuit and devices
+            "test_parser1.43.txt", 2, id="wrong_stop_symbol18"
+        ),
+    ],
+    indirect=["parser"],
+)
+def test_parser_stop_symbol_count(parser, count):
+    """Test parser counts one error per wrong stop symbol"""
+    parser.parse_network()
+    assert parser.error_count == count
 
 
 def test_parser_multiple_errors():  # multiple minor syntax errors
     """Test parser can correctly count errors"""
-    parser = new_parser(str(Path("test_files/test_parser1.21.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.21.txt"))
     assert parser.parse_network() == False
     assert parser.error_count == 18
 
 
-def test_parser_bad_pinname(capfd):  # / instead of , in device definition
-    """Wrong symbol instead of comma in device definition"""
-    parser = new_parser(str(Path("test_files/test_parser1.22.txt")))
-    assert parser.parse_network() == False
-    out, _ = capfd.readouterr()
-    assert (
-        out
-        == "\n\nError on line 7:\n\n"
-        + "    nand1, nand2, nand3/ nand4 = NAND(2);\n"
-        + "                       ^\n\n"
-        + "Expected '=' or ','\n"
-        + "Error Count: 1\n"
-    )
-
-
 def test_parser_no_semicolons():  # missing 3 final semicolons
     """Test parser gives 3 errors when missing final 3 semicolons"""
-    parser = new_parser(str(Path("test_files/test_parser1.23.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.23.txt"))
     assert parser.parse_network() == False
     assert parser.error_count == 3
 
 
-def test_parser_wrong_stop_symbol1(capfd):  # , instead of ; end of devices
-    """Comma instead of semicolon at the end of devices"""
-    parser = new_parser(str(Path("test_files/test_parser1.24.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 13:\n\n" +
-#             "    dt1 = DTYPE,\n" +
-#             "               ^\n\n" +
-#             "Expected ';'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol2(capfd):  # , instead of ; end of connect
-    """Comma instead of semicolon at the end of connect"""
-    parser = new_parser(str(Path("test_files/test_parser1.25.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 33:\n\n" +
-#             "    dt1.QBAR > nand4.I1,\n" +
-#             "                       ^\n\n" +
-#             "Expected ';'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol3(capfd):  # , instead of ; end of monitor
-    """Comma instead of semicolon at the end of monitor"""
-    parser = new_parser(str(Path("test_files/test_parser1.28.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 38:\n\n" +
-#             "    xor2; nand4,\n" +
-#             "               ^\n\n" +
-#             "Expected ';'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol4():  # , instead of ; end of all
-    """Comma instead of semicolon at the end of all 3 sections"""
-    parser = new_parser(str(Path("test_files/test_parser1.29.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 3
-
-
-def test_parser_wrong_stop_symbol5():  # wrong symbol instead of ; end of all
-    """Unknown symbols instead of semicolon at the end of all 3 sections"""
-    parser = new_parser(str(Path("test_files/test_parser1.30.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 3
-
-
-def test_parser_wrong_stop_symbol6(capfd):  # , instead of ; middle of monitor
-    """Comma instead of semicolon in the middle of monitor"""
-    parser = new_parser(str(Path("test_files/test_parser1.31.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 38:\n\n" +
-#             "    xor2, nand4;\n" +
-#             "        ^\n\n" +
-#             "Expected ';'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol7(capfd):  # / instead of } end of devices
-    """Wrong symbol instead of right curly bracket at the end of devices"""
-    parser = new_parser(str(Path("test_files/test_parser1.32.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 14:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '}'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol8(capfd):  # / instead of } end of connect
-    """Wrong symbol instead of right curly bracket at the end of connect"""
-    parser = new_parser(str(Path("test_files/test_parser1.33.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 34:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '}'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol9(capfd):  # / instead of } end of monitor
-    """Wrong symbol instead of right curly bracket at the end of monitor"""
-    parser = new_parser(str(Path("test_files/test_parser1.34.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 39:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '}'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol10(capfd):  # / instead of } end of circuit
-    """Wrong symbol instead of right curly bracket at the end of circuit"""
-    parser = new_parser(str(Path("test_files/test_parser1.35.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 41:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '}'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol11(capfd):  # / instead of { start of circuit
-    """Wrong symbol instead of left curly bracket at the start of circuit"""
-    parser = new_parser(str(Path("test_files/test_parser1.36.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 2:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '{'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol12(capfd):  # / instead of { start of devices
-    """Wrong symbol instead of left curly bracket at the start of devices"""
-    parser = new_parser(str(Path("test_files/test_parser1.37.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 5:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '{'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol13(capfd):  # / instead of { start of connect
-    """Wrong symbol instead of left curly bracket at the start of connect"""
-    parser = new_parser(str(Path("test_files/test_parser1.38.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 17:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '{'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol14(capfd):  # / instead of { start of monitor
-    """Wrong symbol instead of left curly bracket at the start of monitor"""
-    parser = new_parser(str(Path("test_files/test_parser1.39.txt")))
-    assert parser.parse_network() == False
-
-
-#     out, _ = capfd.readouterr()
-#     assert (out == "\n\nError on line 37:\n\n" +
-#             "/\n" +
-#             "^\n\n" +
-#             "Expected '{'\n" +
-#             "Error Count: 1\n")
-
-
-def test_parser_wrong_stop_symbol15():  # / instead of } all
-    """Wrong symbol instead of right curly bracket at the end of all"""
-    parser = new_parser(str(Path("test_files/test_parser1.40.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 4
-
-
-def test_parser_wrong_stop_symbol16():  # / instead of { all
-    """Wrong symbol instead of left curly bracket at the start of all"""
-    parser = new_parser(str(Path("test_files/test_parser1.41.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 4
-
-
-def test_parser_wrong_stop_symbol17():  # / instead of { circuit and devices
-    """/ instead of { at start of circuit and missing { at start of devices"""
-    parser = new_parser(str(Path("test_files/test_parser1.42.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 2
-
-
-def test_parser_wrong_stop_symbol18():  # / instead of { circuit and devices
-    """/ instead of { at start of circuit and devices"""
-    parser = new_parser(str(Path("test_files/test_parser1.43.txt")))
-    assert parser.parse_network() == False
-
-
-#     assert parser.error_count == 2
-
-
 def test_parser_no_keywords():  # missing CIRCUIT, DEVICES etc
     """Missing all keywords in file"""
-    parser = new_parser(str(Path("test_files/test_parser1.26.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.26.txt"))
     assert parser.parse_network() == False
     assert parser.error_count == 5
 
 
 def test_parser_no_right_brace():  # missing all right braces
     """Missing all right braces in file"""
-    parser = new_parser(str(Path("test_files/test_parser1.27.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.27.txt"))
     assert parser.parse_network() == False
     assert parser.error_count == 4
 
 
 def test_empty_file():
     """Test parser can handle an empty file"""
-    parser = new_parser(str(Path("test_files/test_parser1.44.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser1.44.txt"))
     assert parser.parse_network() == False
 
 
-def test_parser_input_to_input(capfd):
-    """Semantic error input connected to input"""
-    parser = new_parser(str(Path("test_files/test_parser2.1.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 22:\n\n    or1.I1 > nand1.I2;\n                 "
-        "  ^\n\nInput already connected\nError Count: 1\n"
-    )
-
-
-def test_parser_output_to_output(capfd):
-    """Semantic error output connected to output"""
-    parser = new_parser(str(Path("test_files/test_parser2.2.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 21:\n\n    xor1 > nand1.I1, nor1;\n        "
-        " ^\n\nOutput connected to output\nError Count: 1\n"
-    )
-
-
-def test_parser_input_not_connected(capfd):
-    """Semantic error input not connected"""
-    parser = new_parser(str(Path("test_files/test_parser2.3.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 16:\n\nCONNECT\n^\n\nunconnected inputs:"
-        " nand3.I1 xor2.I1 \nError Count: 1\n"
-    )
-
-
-def test_parser_multiple_connections_to_input(capfd):
-    """Semantic error multiple connections to input"""
-    parser = new_parser(str(Path("test_files/test_parser2.4.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 28:\n\n    and1 > dt1.DATA, nand2.I1;\n         "
-        "                  ^\n\nInput already connected\nError Count: 1\n"
-    )
-
-
-def test_parser_devicename_not_found(capfd):
-    """Semantic error reference undeclared device"""
-    parser = new_parser(str(Path("test_files/test_parser2.5.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 18:\n\n    SW1 > xor1.I1, or1.I1;\n         "
-        " ^\n\nSpecified device does not exist\nError Count: 1\n"
-    )
-
-
-def test_parser_pinname_not_found(capfd):
-    """Semantic error reference pinname I3 but gate only has 2 inputs"""
-    parser = new_parser(str(Path("test_files/test_parser2.6.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 27:\n\n    nand3 > and1.I3, nand4.I2;\n         "
-        "        ^\n\nSpecified port does not exist\nError Count: 1\n"
-    )
-
-
-def test_parser_too_many_inputs(capfd):
-    """Semantic error and gate has 17 inputs"""
-    parser = new_parser(str(Path("test_files/test_parser2.7.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 11:\n\n    and1 = AND(17);\n              "
-        " ^\n\nNumber of inputs must be between 1-16\nError Count: 1\n"
-    )
-
-
-def test_parser_devicename_keyword(capfd):
-    """Semantic error devicename should not be keyword"""
-    parser = new_parser(str(Path("test_files/test_parser2.8.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 13:\n\n    DEVICES = DTYPE;\n    ^\n\nNames"
-        " cannot"
-        " be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT', 'MONITOR',"
-        " 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR', 'XOR',"
-        " 'NOT', 'DTYPE'\nError Count: 1\n"
-    )
-
-
-def test_parser_pinname_keyword(capfd):
-    """Semantic error pinname should not be keyword"""
-    parser = new_parser(str(Path("test_files/test_parser2.9.txt")))
-    assert not parser.parse_network()
-    output = capfd.readouterr()[0]
-    assert (
-        output
-        == "\n\nError on line 31:\n\n    SW5 > dt1.CONNECT;\n             "
-        " ^\n\nNames cannot be Keywords: 'CIRCUIT', 'DEVICES', 'CONNECT',"
-        " 'MONITOR', 'END','CLOCK', 'SWITCH', 'AND', 'NAND', 'OR', 'NOR',"
-        " 'XOR', 'NOT', 'DTYPE'\nError Count: 1\n"
-    )
-
-
-def test_parser_semantic_semantic(capfd):
+def test_parser_semantic_semantic(capsys):
     """Test parser continues after semantic error"""
-    parser = new_parser(str(Path("test_files/test_parser2.10a.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser2.10a.txt"))
     assert not parser.parse_network()
     assert parser.error_count == 2
-    output = capfd.readouterr()[0]
+    output = capsys.readouterr()[0]
     assert (
         output
         == "\n\nError on line 11:\n\n    and1 = AND(17);\n              "
@@ -753,12 +526,12 @@ def test_parser_semantic_semantic(capfd):
     )
 
 
-def test_parser_semantic_semantic2(capfd):
+def test_parser_semantic_semantic2(capsys):
     """Test parser only finds first of 2 semantic errors"""
-    parser = new_parser(str(Path("test_files/test_parser2.10b.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser2.10b.txt"))
     assert not parser.parse_network()
     assert parser.error_count == 1
-    output = capfd.readouterr()[0]
+    output = capsys.readouterr()[0]
     assert (
         output
         == "\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
@@ -766,12 +539,12 @@ def test_parser_semantic_semantic2(capfd):
     )
 
 
-def test_parser_semantic_syntax(capfd):
+def test_parser_semantic_syntax(capsys):
     """Test parser finds syntax error after semantic error"""
-    parser = new_parser(str(Path("test_files/test_parser2.11.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser2.11.txt"))
     assert not parser.parse_network()
     assert parser.error_count == 2
-    output = capfd.readouterr()[0]
+    output = capsys.readouterr()[0]
     assert (
         output
         == "\n\nError on line 18:\n\n    SW11 > xor1.I1, or1.I1;\n   "
@@ -780,15 +553,57 @@ def test_parser_semantic_syntax(capfd):
     )
 
 
-def test_parser_syntax_semantic(capfd):
+def test_parser_syntax_semantic(capsys):
     """Test parser doesn't find semantic error after syntax error"""
-    parser = new_parser(str(Path("test_files/test_parser2.12.txt")))
+    parser = new_parser(str(TEST_FILES / "test_parser2.12.txt"))
     assert not parser.parse_network()
     assert parser.error_count == 1
-    output = capfd.readouterr()[0]
+    output = capsys.readouterr()[0]
     assert (
         output
         == "\n\nError on line 6:\n\n    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
         "                            ^\n\nExpected '=' or ','\nError"
         " Count: 1\n"
     )
+
+
+def test_parser_errors_before_open_comment(capsys):
+    """Test parser errors are printed before a later open comment error"""
+    parser = new_parser(str(TEST_FILES / "test_parser3.1.txt"))
+    assert not parser.parse_network()
+    output = capsys.readouterr()[0]
+    assert output.index("Error on line 3:") < output.index(
+        "File ended with open comment"
+    )
+
+
+def test_parser_back_to_back_comments(capsys):
+    """Test a file with comments that follow each other parses cleanly"""
+    parser = new_parser(str(TEST_FILES / "test_scanner3b.txt"))
+    assert parser.parse_network()
+    assert parser.error_count == 0
+    assert capsys.readouterr()[0] == "Error Count: 0\n"
+
+
+def test_parser_pxd_matches_slots():
+    """Test parse.pxd declares exactly the attributes in Parser.__slots__"""
+    here = Path(__file__).resolve().parent
+    # read both from source, since a compiled Parser has no __slots__
+    module = ast.parse((here / "parse.py").read_text())
+    [parser_class] = [
+        node
+        for node in module.body
+        if isinstance(node, ast.ClassDef) and node.name == "Parser"
+    ]
+    [slots] = [
+        node.value
+        for node in parser_class.body
+        if isinstance(node, ast.Assign)
+        and [target.id for target in node.targets] == ["__slots__"]
+    ]
+    declared = [
+        line.split()[-1]
+        for line in (here / "parse.pxd").read_text().splitlines()
+        if line.startswith("    cdef ")
+    ]
+    assert declared == list(ast.literal_eval(slots))
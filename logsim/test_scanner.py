@@ -1,12 +1,16 @@
+import itertools
 import pytest
 from pathlib import Path
 from scanner import *
 from names import Names
 
+# circuit definition files used by the tests, found from this file so the
+# tests can run from any directory
+TEST_FILES = Path(__file__).resolve().parent / "test_files"
 
-def test_symbol():
-    names = Names()
-    scanner = Scanner(str(Path("test_files/test0.txt")), names)
+
+def test_symbol(scanner_factory):
+    scanner = scanner_factory(str(TEST_FILES / "test0.txt"))
     test_string = [
         "CIRCUIT",
         "{",
@@ -76,9 +80,9 @@ def test_scanner_spaces():
     names1 = Names()
     names2 = Names()
     names3 = Names()
-    scanner1 = Scanner(str(Path("test_files/test_scanner1a.txt")), names1)
-    scanner2 = Scanner(str(Path("test_files/test_scanner1b.txt")), names2)
-    scanner3 = Scanner(str(Path("test_files/test_scanner1c.txt")), names3)
+    scanner1 = Scanner(str(TEST_FILES / "test_scanner1a.txt"), names1)
+    scanner2 = Scanner(str(TEST_FILES / "test_scanner1b.txt"), names2)
+    scanner3 = Scanner(str(TEST_FILES / "test_scanner1c.txt"), names3)
     for i in range(15):
         symbol1 = scanner1.get_symbol()
         symbol2 = scanner2.get_symbol()
@@ -87,11 +91,9 @@ def test_scanner_spaces():
         assert symbol1 is not None
 
 
-def test_line_break():
-    names1 = Names()
-    scanner1 = Scanner(str(Path("test_files/test2a.txt")), names1)
-    names2 = Names()
-    scanner2 = Scanner(str(Path("test_files/test2b.txt")), names2)
+def test_line_break(scanner_factory):
+    scanner1 = scanner_factory(str(TEST_FILES / "test2a.txt"))
+    scanner2 = scanner_factory(str(TEST_FILES / "test2b.txt"))
     while True:
         symbol1 = scanner1.get_symbol()
         symbol2 = scanner2.get_symbol()
@@ -103,20 +105,30 @@ def test_line_break():
 def test_scanner_comments():
     names1 = Names()
     names2 = Names()
-    scanner1 = Scanner(str(Path("test_files/test_scanner3a.txt")), names1)
-    scanner2 = Scanner(str(Path("test_files/test_scanner3b.txt")), names2)
-    for i in range(215):
-        symbol1 = scanner1.get_symbol()
-        symbol2 = scanner2.get_symbol()
+    scanner1 = Scanner(str(TEST_FILES / "test_scanner3a.txt"), names1)
+    scanner2 = Scanner(str(TEST_FILES / "test_scanner3b.txt"), names2)
+    symbols = zip(scanner1.iter_symbols(), scanner2.iter_symbols())
+    for symbol1, symbol2 in itertools.islice(symbols, 215):
         assert symbol1.type == symbol2.type
         assert symbol1 is not None
 
 
-def test_complex_comments():
-    names1 = Names()
-    scanner1 = Scanner(str(Path("test_files/test4a.txt")), names1)
-    names2 = Names()
-    scanner2 = Scanner(str(Path("test_files/test4b.txt")), names2)
+def test_scanner_back_to_back_comments():
+    """Test that comments can follow each other with nothing between."""
+    scanner1 = Scanner(str(TEST_FILES / "test_scanner3a.txt"), Names())
+    scanner2 = Scanner(str(TEST_FILES / "test_scanner3b.txt"), Names())
+    symbols1 = [
+        (symbol.type, symbol.string) for symbol in scanner1.iter_symbols()
+    ]
+    symbols2 = [
+        (symbol.type, symbol.string) for symbol in scanner2.iter_symbols()
+    ]
+    assert symbols1 == symbols2
+
+
+def test_complex_comments(scanner_factory):
+    scanner1 = scanner_factory(str(TEST_FILES / "test4a.txt"))
+    scanner2 = scanner_factory(str(TEST_FILES / "test4b.txt"))
     while True:
         symbol1 = scanner1.get_symbol()
         symbol2 = scanner2.get_symbol()
@@ -125,53 +137,67 @@ def test_complex_comments():
             break
 
 
+def test_tokenize_all(scanner_factory):
+    scanner = scanner_factory(str(TEST_FILES / "test_scanner3b.txt"))
+    types, starts, ends = scanner.tokenize_all()
+    symbols = list(scanner.iter_symbols())
+    assert len(types) == len(symbols)
+    for symbol_type, start, end, symbol in zip(types, starts, ends, symbols):
+        if symbol.type == scanner.KEYWORD:
+            assert symbol_type == scanner.NAME
+        else:
+            assert symbol_type == symbol.type
+        assert start == symbol.position
+        assert scanner.text[start:end] == symbol.string
+
+
 def test_scanner_error_message():
     names1 = Names()
-    scanner1 = Scanner(str(Path("test_files/test_scanner5a.txt")), names1)
+    scanner1 = Scanner(str(TEST_FILES / "test_scanner5a.txt"), names1)
     for i in range(13):
         scanner1.get_symbol()
     test_symbol = scanner1.get_symbol()
     assert (
         scanner1.print_error(test_symbol)
         == "Error on line 6:\n\n    SW1, SW2, SW3, SW4, SW5 - SWITCH(0);\n"
-        + "                            ^\n\n"
+        "                            ^\n\n"
     )
 
     names2 = Names()
-    scanner2 = Scanner(str(Path("test_files/test_scanner5b.txt")), names2)
+    scanner2 = Scanner(str(TEST_FILES / "test_scanner5b.txt"), names2)
     for i in range(21):
         scanner2.get_symbol()
     test_symbol = scanner2.get_symbol()
     assert (
         scanner2.print_error(test_symbol) ==
         "Error on line 7:\n\n    nand1, 22, nand3, nand4 = NAND(2);\n"
-        + "           ^\n\n"
+        "           ^\n\n"
     )
 
     names3 = Names()
-    scanner3 = Scanner(str(Path("test_files/test_scanner5c.txt")), names3)
+    scanner3 = Scanner(str(TEST_FILES / "test_scanner5c.txt"), names3)
     for i in range(88):
         scanner3.get_symbol()
     test_symbol = scanner3.get_symbol()
     assert (
         scanner3.print_error(test_symbol)
         == "Error on line 19:\n\n    SW2 > xor1:I2, nor1.I1;\n"
-        + "              ^\n\n"
+        "              ^\n\n"
     )
 
     names4 = Names()
-    scanner4 = Scanner(str(Path("test_files/test_scanner5d.txt")), names4)
+    scanner4 = Scanner(str(TEST_FILES / "test_scanner5d.txt"), names4)
     for i in range(30):
         scanner4.get_symbol()
     test_symbol = scanner4.get_symbol()
     assert (
         scanner4.print_error(test_symbol)
         == "Error on line 7:\n\n    nand1, nand2, nand3, nand4 = NAND(2];\n"
-        + "                                       ^\n\n"
+        "                                       ^\n\n"
     )
 
     names5 = Names()
-    scanner5 = Scanner(str(Path("test_files/test_scanner5e.txt")), names5)
+    scanner5 = Scanner(str(TEST_FILES / "test_scanner5e.txt"), names5)
     test_symbol = scanner5.get_symbol()
     assert (
         scanner5.print_error(test_symbol)
@@ -181,7 +207,7 @@ def test_scanner_error_message():
 
 def test_error_message_2():
     names = Names()
-    scanner = Scanner(str(Path("test_files/test6.txt")), names)
+    scanner = Scanner(str(TEST_FILES / "test6.txt"), names)
     for i in range(35):
         scanner.get_symbol()
     test_symbol = scanner.get_symbol()
@@ -194,14 +220,14 @@ def test_error_message_2():
 
 def test_error_message_multiple_errors():
     names = Names()
-    scanner = Scanner(str(Path("test_files/test_scanner7.txt")), names)
+    scanner = Scanner(str(TEST_FILES / "test_scanner7.txt"), names)
     for i in range(7):
         scanner.get_symbol()
     test_symbol = scanner.get_symbol()
     assert (
         scanner.print_error(test_symbol)
         == "Error on line 6:\n\n    SW1, SW2/ SW3, SW4, SW5 = SWITCH(0);\n"
-        + "            ^\n\n"
+        "            ^\n\n"
     )
     for i in range(22):
         scanner.get_symbol()
@@ -209,7 +235,7 @@ def test_error_message_multiple_errors():
     assert (
         scanner.print_error(test_symbol)
         == "Error on line 7:\n\n    nand1, nand2, nand3, nand4 = NAND(2};\n"
-        + "                                       ^\n\n"
+        "                                       ^\n\n"
     )
     for i in range(13):
         scanner.get_symbol()
@@ -245,7 +271,7 @@ def test_error_message_multiple_errors():
     assert (
         scanner.print_error(test_symbol)
         == "Error on line 26:\n\n    nand2 > nor2.I2} nand3.I1;\n"
-        + "                   ^\n\n"
+        "                   ^\n\n"
     )
     for i in range(64):
         scanner.get_symbol()
@@ -253,7 +279,7 @@ def test_error_message_multiple_errors():
     assert (
         scanner.print_error(test_symbol)
         == "Error on line 34:\n\n    dt1.QBAR > nand4.I1;;\n"
-        + "                        ^\n\n"
+        "                        ^\n\n"
     )
     for i in range(6):
         scanner.get_symbol()
@@ -262,3 +288,45 @@ def test_error_message_multiple_errors():
         scanner.print_error(test_symbol)
         == "Error on line 40:\n\n}\n^\n\n"
     )
+
+
+def test_scanner_unicode():
+    """Test that non-ASCII whitespace, letters and digits are recognised."""
+    scanner = Scanner(str(TEST_FILES / "test_scanner6.txt"), Names())
+    symbols = [
+        (symbol.type, symbol.string) for symbol in scanner.iter_symbols()
+    ]
+    assert symbols == [
+        (scanner.KEYWORD, "CIRCUIT"),
+        (scanner.BRACE_LEFT, "{"),
+        (scanner.NAME, "sw\xe91"),
+        (scanner.EQUALS, "="),
+        (scanner.KEYWORD, "SWITCH"),
+        (scanner.PARENTHESIS_LEFT, "("),
+        (scanner.ZERO, "٠"),
+        (scanner.PARENTHESIS_RIGHT, ")"),
+        (scanner.SEMICOLON, ";"),
+        (scanner.NAME, "CL1"),
+        (scanner.EQUALS, "="),
+        (scanner.KEYWORD, "CLOCK"),
+        (scanner.PARENTHESIS_LEFT, "("),
+        (scanner.NUMBER, "٢٠"),
+        (scanner.PARENTHESIS_RIGHT, ")"),
+        (scanner.INVALID_CHARACTER, "€"),
+        (scanner.EOF, ""),
+    ]
+
+
+def test_scanner_repeated_eof():
+    """Test that every symbol read after the end of file is at its end."""
+    scanner = Scanner(str(TEST_FILES / "test_scanner5e.txt"), Names())
+    for symbol in scanner.iter_symbols():
+        pass
+    for i in range(3):
+        test_symbol = scanner.get_symbol()
+        assert test_symbol.type == scanner.EOF
+        assert test_symbol.position == len(scanner.text)
+    assert (
+        scanner.print_error(test_symbol)
+        == "Error on line 1:\n\nCIRCUITO{}\n          ^\n\n"
+    )
@@ -0,0 +1,24 @@
+"""Test the Cython scanner_core build against the interpreted scan."""
+from pathlib import Path
+
+import pytest
+
+from names import Names
+from scanner import Scanner, python_scan_symbol
+
+# skip every test here unless scanner_core.pyx has been built
+scanner_core = pytest.importorskip("scanner_core")
+
+TEST_FILES = Path(__file__).resolve().parent / "test_files"
+
+
+@pytest.mark.parametrize(
+    "path", sorted(TEST_FILES.glob("*.txt")), ids=lambda path: path.name
+)
+def test_scan_symbol_matches_python(path):
+    """Test the compiled scan finds the same symbols from every position."""
+    buffer = Scanner(str(path), Names()).buffer
+    for position in range(len(buffer) + 1):
+        assert scanner_core.scan_symbol(
+            buffer, position
+        ) == python_scan_symbol(buffer, position)
@@ -1,6 +1,10 @@
+import gettext
 import sys
+from pathlib import Path
 
-# import required packages for translation
+# message catalogues, laid out as wx.Locale looks them up
+LOCALE_PATH = Path(__file__).resolve().parent / "locale"
+CATALOGUES = {"ES": LOCALE_PATH / "es_ES" / "logsim_es.mo"}
 
 
 class Translator:
@@ -13,6 +17,8 @@ class Translator:
             print(f'\nLanguage ID ("{lang}") invalid. Options are:')
             print(list(self.lang_options.values()))
             sys.exit()
+        # catalogues loaded so far, keyed by language ID
+        self.translations = {}
 
     def get_translation(self, string):
         """Translates the given string to the selected language.
@@ -23,5 +29,22 @@ class Translator:
         Returns:
             translated string
         """
-        # translate string
-        return string
+        # translate string with the current language's catalogue
+        return self.load_translation(self.lang).gettext(string)
+
+    def load_translation(self, lang):
+        """Return the translations for lang, loading its catalogue once.
+
+        Falls back to untranslated strings when lang has no catalogue or
+        the catalogue cannot be read.
+        """
+        if lang not in self.translations:
+            translation = gettext.NullTranslations()
+            if lang in CATALOGUES:
+                try:
+                    with open(CATALOGUES[lang], "rb") as catalogue_file:
+                        translation = gettext.GNUTranslations(catalogue_file)
+                except (OSError, LookupError):  # missing or unreadable
+                    pass
+            self.translations[lang] = translation
+        return self.translations[lang]
@@ -0,0 +1,20 @@
+"""Shared fixtures for the Logic Simulator tests."""
+import builtins
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wx_translation():
+    """Install wx's gettext as _ for the modules under test.
+
+    wx is imported when the first test runs rather than when each test
+    module is collected. Without wx, _ returns its string untranslated.
+    """
+    try:
+        import wx
+    except ImportError:
+        builtins._ = lambda string: string
+    else:
+        builtins._ = wx.GetTranslation
+    yield
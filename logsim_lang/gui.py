@@ -527,34 +527,34 @@ class Gui(wx.Frame):
         self.menuBar = wx.MenuBar()
         self.fileMenu = wx.Menu()
         self.fileMenu.Append(
-            wx.ID_ABOUT, _(_("About"))
+            wx.ID_ABOUT, _("About")
         )
         self.fileMenu.Append(
-            wx.ID_OPEN, _(_("Open File"))
+            wx.ID_OPEN, _("Open File")
         )
         self.saveMenu = wx.Menu()
         self.saveMenu.Append(
             wx.ID_SAVE,
-            _(_("Save Visible Plot Area")),
+            _("Save Visible Plot Area"),
         )
         self.saveMenu.Append(
-            wx.ID_SAVEAS, _(_("Save Full Plot"))
+            wx.ID_SAVEAS, _("Save Full Plot")
         )
         self.fileMenu.AppendSubMenu(
-            self.saveMenu, _(_("Save Image"))
+            self.saveMenu, _("Save Image")
         )
         self.fileMenu.Append(
-            wx.ID_EXIT, _(_("Exit"))
+            wx.ID_EXIT, _("Exit")
         )
         self.menuBar.Append(
-            self.fileMenu, _(_("File"))
+            self.fileMenu, _("File")
         )
         self.viewMenu = wx.Menu()
         self.viewMenu.Append(
-            wx.ID_RESET, _(_("Reset View"))
+            wx.ID_RESET, _("Reset View")
         )
         self.menuBar.Append(
-            self.viewMenu, _(_("View"))
+            self.viewMenu, _("View")
         )
         self.SetMenuBar(self.menuBar)
 
@@ -565,19 +565,19 @@ class Gui(wx.Frame):
         self.text_run = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Cycles to run/continue for:")),
+            _("Cycles to run/continue for:"),
         )
         self.spin = wx.SpinCtrl(self, wx.ID_ANY, "10", max=1000, min=1)
         self.run_button = wx.Button(
-            self, wx.ID_ANY, _(_("Run"))
+            self, wx.ID_ANY, _("Run")
         )
         self.restart_button = wx.Button(
-            self, wx.ID_ANY, _(_("Restart"))
+            self, wx.ID_ANY, _("Restart")
         )
         self.text_add_mon = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Select a monitor point to add:")),
+            _("Select a monitor point to add:"),
         )
         self.add_box = wx.Choice(
             self,
@@ -585,7 +585,7 @@ class Gui(wx.Frame):
             choices=self.not_monitored_list,
         )
         self.add_button = wx.Button(
-            self, wx.ID_ANY, _(_("Add"))
+            self, wx.ID_ANY, _("Add")
         )
         self.text_zap_mon = wx.StaticText(
             self,
@@ -600,12 +600,12 @@ class Gui(wx.Frame):
             choices=self.monitored_list,
         )
         self.zap_button = wx.Button(
-            self, wx.ID_ANY, _(_("Remove"))
+            self, wx.ID_ANY, _("Remove")
         )
         self.text_switch = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Select a switch to toggle:")),
+            _("Select a switch to toggle:"),
         )
         self.switch_box = wx.Choice(self, wx.ID_ANY, choices=self.switch_names)
         self.toggle_0 = wx.ToggleButton(self, wx.ID_ANY, label="0")
@@ -613,7 +613,7 @@ class Gui(wx.Frame):
         self.replace_text_1 = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("Replace connection:")),
+            _("Replace connection:"),
         )
         self.swap_conn_box = wx.Choice(
             self, wx.ID_ANY, choices=self.conn_name_list
@@ -621,11 +621,11 @@ class Gui(wx.Frame):
         self.replace_text_2 = wx.StaticText(
             self,
             wx.ID_ANY,
-            _(_("with connection:")),
+            _("with connection:"),
         )
         self.new_conn_box = wx.Choice(self, wx.ID_ANY, choices=[])
         self.replace_button = wx.Button(
-            self, wx.ID_ANY, _(_("Replace"))
+            self, wx.ID_ANY, _("Replace")
         )
         self.horizontal_scrollbar = wx.ScrollBar(
             self,
@@ -1085,8 +1085,8 @@ class Gui(wx.Frame):
                     )
                     undo = True
                 else:
-                    message += _(
-                        "Error! Could not swap connection: "
+                    message += (
+                        _("Error! Could not swap connection: ")
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1131,8 +1131,8 @@ class Gui(wx.Frame):
                         "Successfully undid connection swap.\n"
                     )
                 else:
-                    message += _(
-                        "Error! Could not undo connection swap: "
+                    message += (
+                        _("Error! Could not undo connection swap: ")
                         + self.network.error_message[error]
                         + ".\n"
                     )
@@ -1511,7 +1511,6 @@ class Gui(wx.Frame):
             choicebox -- wx.Choice widget
             choices -- list of strings to add as choices
         """
-        choicebox.Clear()
-        for item in choices:
-            choicebox.Append(item)
+        # replace all the items in one update of the widget
+        choicebox.Set(choices)
 
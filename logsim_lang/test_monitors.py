@@ -5,10 +5,6 @@ from names import Names
 from network import Network
 from devices import Devices
 from monitors import Monitors
-import builtins
-import wx 
-
-builtins._ = wx.GetTranslation
 
 @pytest.fixture
 def new_monitors():
@@ -4,10 +4,6 @@ import pytest
 from names import Names
 from devices import Devices
 from network import Network
-import builtins
-import wx 
-
-builtins._ = wx.GetTranslation
 
 @pytest.fixture
 def new_network():
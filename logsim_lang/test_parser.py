@@ -9,10 +9,6 @@ from network import Network
 from devices import Devices
 from monitors import Monitors
 from translate import Translator
-import builtins
-import wx 
-
-builtins._ = wx.GetTranslation
 
 def new_parser(path):
     """Return a new parser instance"""
@@ -362,7 +358,7 @@ def test_parser_multiple_errors():  # multiple minor syntax errors
     assert parser.error_count == 18
 
 
-def test_parser_bad_pinname(capfd):  # / instead of , in device definition
+def test_parser_bad_comma_in_device_def(capfd):  # / instead of , in DEVICES
     """Wrong symbol instead of comma in device definition"""
     parser = new_parser(str(Path("test_files/test_parser1.22.txt")))
     assert parser.parse_network() == False